@@ -5,6 +5,7 @@ Provides prompts for creating new pieces, yarns, and stitches.
 """
 
 from datetime import date
+from functools import lru_cache
 from decimal import Decimal
 from typing import Optional, List, Any, Dict
 
@@ -13,12 +14,20 @@ from ..models.yarn import Yarn, CareInstructions
 from ..models.stitch import Stitch
 from ..services import DataService
 
+_CENTS = Decimal("0.01")
+
+
+@lru_cache(maxsize=1)
+def _default_service() -> DataService:
+    """Shared DataService for helpers created without one."""
+    return DataService()
+
 
 class DataEntryHelper:
     """Interactive data entry helper."""
 
     def __init__(self, data_service: DataService = None):
-        self.data_service = data_service or DataService()
+        self.data_service = data_service or _default_service()
 
     def prompt(self, message: str, default: Any = None, required: bool = False) -> str:
         """
@@ -67,10 +76,12 @@ class DataEntryHelper:
         Returns:
             Selected choice.
         """
-        print(f"{message}")
-        for i, choice in enumerate(choices, 1):
-            marker = "*" if choice == default else " "
-            print(f"  {marker}{i}. {choice}")
+        choice_set = frozenset(choices)
+        menu = "\n".join(
+            f"  {'*' if choice == default else ' '}{i}. {choice}"
+            for i, choice in enumerate(choices, 1)
+        )
+        print(f"{message}\n{menu}")
 
         while True:
             value = self.prompt("Enter number or value", default)
@@ -84,7 +95,7 @@ class DataEntryHelper:
                 pass
 
             # Check if it's a valid choice
-            if value in choices:
+            if value in choice_set:
                 return value
 
             print(f"  Invalid choice. Enter 1-{len(choices)} or type the value.")
@@ -277,7 +288,7 @@ class DataEntryHelper:
             weight_category=weight,
             ball_weight_g=ball_weight,
             ball_length_m=ball_length,
-            price_paid=Decimal(str(price)) if price else None,
+            price_paid=Decimal.from_float(price).quantize(_CENTS) if price else None,
             purchase_location=purchase_location or None,
             purchase_link=purchase_link or None,
             purchase_date=purchase_date,
@@ -341,8 +352,8 @@ def interactive_entry(entity_type: str) -> None:
     Args:
         entity_type: "piece", "yarn", or "stitch".
     """
-    helper = DataEntryHelper()
     data_service = DataService()
+    helper = DataEntryHelper(data_service)
 
     if entity_type == "piece":
         entity = helper.create_piece_interactive()
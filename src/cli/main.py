@@ -16,8 +16,6 @@ import argparse
 import sys
 from typing import List
 
-from ..services import DataService, PriceService, TimeService
-
 
 def cmd_inbox(args):
     """Process inbox files."""
@@ -27,6 +25,7 @@ def cmd_inbox(args):
 
 def cmd_price(args):
     """Calculate price for a piece."""
+    from ..services import PriceService
     price_service = PriceService()
 
     try:
@@ -56,6 +55,7 @@ def cmd_price(args):
 
 def cmd_time(args):
     """Estimate time for a piece."""
+    from ..services import TimeService
     time_service = TimeService()
 
     estimate = time_service.estimate_total_hours(args.piece_id)
@@ -81,32 +81,40 @@ def cmd_time(args):
 
 def cmd_list(args):
     """List entities."""
+    from ..services import DataService
     data_service = DataService()
 
     if args.entity_type == "pieces":
         items = data_service.load_pieces(include_archived=args.all)
-        print(f"\nPieces ({len(items)}):")
+        lines = [f"\nPieces ({len(items)}):"]
         for item in items:
             status = f"[{item.work_status}]" if item.work_status else ""
-            print(f"  {item.id}: {item.name} {status}")
+            lines.append(f"  {item.id}: {item.name} {status}")
 
     elif args.entity_type == "yarns":
         items = data_service.load_yarns(include_archived=args.all)
-        print(f"\nYarns ({len(items)}):")
+        lines = [f"\nYarns ({len(items)}):"]
         for item in items:
             qty = f"({item.quantity_owned} balls)" if item.quantity_owned else ""
-            print(f"  {item.id}: {item.name} - {item.color} {qty}")
+            lines.append(f"  {item.id}: {item.name} - {item.color} {qty}")
 
     elif args.entity_type == "stitches":
         items = data_service.load_stitches(include_archived=args.all)
-        print(f"\nStitches ({len(items)}):")
+        lines = [f"\nStitches ({len(items)}):"]
         for item in items:
             cat = f"[{item.category}]" if item.category else ""
-            print(f"  {item.id}: {item.name} {cat}")
+            lines.append(f"  {item.id}: {item.name} {cat}")
+
+    else:
+        return
+
+    # Emit the whole listing in a single write
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_stats(args):
     """Show statistics."""
+    from ..services import DataService, TimeService
     time_service = TimeService()
     data_service = DataService()
 
@@ -124,17 +132,63 @@ def cmd_stats(args):
             print(f"  {ptype}: {data['average_hours']:.1f} hours ({data['count']} pieces)")
 
     # Yarn inventory
-    yarns = data_service.load_yarns()
-    total_balls = sum(y.quantity_owned or 0 for y in yarns)
-    print(f"\nYarn inventory:        {len(yarns)} types, {total_balls} balls")
+    yarn_count, total_balls = data_service.yarn_stats()
+    print(f"\nYarn inventory:        {yarn_count} types, {total_balls} balls")
 
     # Stitch library
-    stitches = data_service.load_stitches()
-    print(f"Stitch library:        {len(stitches)} stitches")
+    print(f"Stitch library:        {data_service.stitch_count()} stitches")
+
+
+_COMMANDS = {
+    "inbox": cmd_inbox,
+    "price": cmd_price,
+    "time": cmd_time,
+    "list": cmd_list,
+    "stats": cmd_stats,
+}
+
+_LIST_TYPES = ("pieces", "yarns", "stitches")
+_LIST_ALL_FLAGS = ("--all", "-a")
+
+
+def _fast_dispatch(argv: List[str]) -> bool:
+    """
+    Run simple stats/list invocations without building the full parser.
+
+    Only exact, unambiguous argument shapes are handled here; anything
+    else (including --help) falls through to argparse.
+
+    Args:
+        argv: Command-line arguments, excluding the program name.
+
+    Returns:
+        True if the command was handled.
+    """
+    if argv == ["stats"]:
+        cmd_stats(argparse.Namespace(command="stats"))
+        return True
+
+    if 2 <= len(argv) <= 3 and argv[0] == "list" and argv[1] in _LIST_TYPES:
+        flags = argv[2:]
+        if all(flag in _LIST_ALL_FLAGS for flag in flags):
+            cmd_list(argparse.Namespace(
+                command="list",
+                entity_type=argv[1],
+                all=bool(flags),
+            ))
+            return True
+
+    return False
 
 
 def main(argv: List[str] = None):
     """Main CLI entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if _fast_dispatch(argv):
+        return
+
     parser = argparse.ArgumentParser(
         description="Crochet Project Manager CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -178,11 +232,11 @@ def main(argv: List[str] = None):
     list_parser = subparsers.add_parser("list", help="List entities")
     list_parser.add_argument(
         "entity_type",
-        choices=["pieces", "yarns", "stitches"],
+        choices=list(_LIST_TYPES),
         help="Entity type to list"
     )
     list_parser.add_argument(
-        "--all", "-a",
+        *_LIST_ALL_FLAGS,
         action="store_true",
         help="Include archived items"
     )
@@ -196,15 +250,7 @@ def main(argv: List[str] = None):
         parser.print_help()
         sys.exit(0)
 
-    commands = {
-        "inbox": cmd_inbox,
-        "price": cmd_price,
-        "time": cmd_time,
-        "list": cmd_list,
-        "stats": cmd_stats,
-    }
-
-    commands[args.command](args)
+    _COMMANDS[args.command](args)
 
 
 if __name__ == "__main__":
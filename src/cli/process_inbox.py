@@ -4,8 +4,12 @@ Inbox processing for photos and files.
 Processes files in inbox directories and creates/updates entities.
 """
 
+import sys
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 from ..config import config
 from ..services import DataService
@@ -13,6 +17,9 @@ from ..utils.photo_utils import PhotoUtils
 from ..utils.date_utils import DateUtils
 from .rename_files import FileRenamer
 
+# Grouping and reporting look up the same filenames, so memoize per run
+_extract_date = lru_cache(maxsize=2048)(DateUtils.extract_date_from_filename)
+
 
 class InboxProcessor:
     """Process inbox files for entity creation."""
@@ -20,6 +27,39 @@ class InboxProcessor:
     def __init__(self, data_service: DataService = None):
         self.data_service = data_service or DataService()
         self.images_path = config.DATA_DIR.parent / "images"
+        self._inbox_cache: Dict[str, Tuple[Path, List[Path]]] = {}
+
+    def _get_inbox(self, entity_type: str) -> Tuple[Path, List[Path]]:
+        """
+        Get the inbox directory and its image files for an entity type.
+
+        Results are cached for the lifetime of the processor; call
+        invalidate() after moving files out of an inbox.
+
+        Args:
+            entity_type: "piece", "yarn", or "stitch".
+
+        Returns:
+            Tuple of (inbox directory, list of image files).
+        """
+        cached = self._inbox_cache.get(entity_type)
+        if cached is None:
+            inbox = PhotoUtils.get_inbox_directory(self.images_path, entity_type)
+            cached = (inbox, PhotoUtils.list_images_in_directory(inbox))
+            self._inbox_cache[entity_type] = cached
+        return cached
+
+    def invalidate(self, entity_type: Optional[str] = None) -> None:
+        """
+        Drop cached inbox listings.
+
+        Args:
+            entity_type: Entity type to refresh, or None for all.
+        """
+        if entity_type is None:
+            self._inbox_cache.clear()
+        else:
+            self._inbox_cache.pop(entity_type, None)
 
     def check_all_inboxes(self) -> Dict[str, List[Path]]:
         """
@@ -31,8 +71,8 @@ class InboxProcessor:
         results = {}
 
         for entity_type in ["piece", "yarn", "stitch"]:
-            inbox = PhotoUtils.get_inbox_directory(self.images_path, entity_type)
-            files = PhotoUtils.list_images_in_directory(inbox)
+            # One listing per inbox; an empty or missing inbox lists as []
+            _, files = self._get_inbox(entity_type)
             if files:
                 results[entity_type] = files
 
@@ -49,15 +89,15 @@ class InboxProcessor:
             print("All inboxes are empty.")
             return
 
-        print("\nPending inbox files:")
-        print("-" * 40)
+        lines = ["\nPending inbox files:", "-" * 40]
 
         for entity_type, files in inboxes.items():
-            print(f"\n{entity_type.title()}s inbox: {len(files)} file(s)")
-            for f in files[:5]:
-                print(f"  - {f.name}")
+            lines.append(f"\n{entity_type.title()}s inbox: {len(files)} file(s)")
+            lines.extend(f"  - {f.name}" for f in files[:5])
             if len(files) > 5:
-                print(f"  ... and {len(files) - 5} more")
+                lines.append(f"  ... and {len(files) - 5} more")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def group_files_by_entity(
         self,
@@ -77,41 +117,40 @@ class InboxProcessor:
         Returns:
             List of file groups (each group = one entity).
         """
-        groups = []
-        current_group = []
-        last_prefix = None
-
-        for filepath in sorted(files):
+        # Compute each file's grouping key once, then sort by (key, name)
+        # and group on the key; plain strings compare faster than Paths
+        keyed = []
+        for filepath in files:
             # Extract date or identifier prefix
-            date = DateUtils.extract_date_from_filename(filepath.name)
-            prefix = date.isoformat() if date else filepath.stem[:10]
+            name = filepath.name
+            file_date = _extract_date(name)
+            prefix = file_date.isoformat() if file_date else filepath.stem[:10]
+            keyed.append((prefix, name, filepath))
 
-            if last_prefix is None or prefix == last_prefix:
-                current_group.append(filepath)
-            else:
-                if current_group:
-                    groups.append(current_group)
-                current_group = [filepath]
+        keyed.sort(key=itemgetter(0, 1))
 
-            last_prefix = prefix
+        return [
+            [filepath for _, _, filepath in group]
+            for _, group in groupby(keyed, key=itemgetter(0))
+        ]
 
-        if current_group:
-            groups.append(current_group)
-
-        return groups
-
-    def process_yarn_inbox(self, dry_run: bool = True) -> List[str]:
+    def process_yarn_inbox(
+        self,
+        dry_run: bool = True,
+        files: Optional[List[Path]] = None
+    ) -> List[str]:
         """
         Process yarn inbox files.
 
         Args:
             dry_run: If True, only show what would be done.
+            files: Already-listed inbox files; scanned if not given.
 
         Returns:
             List of created yarn IDs.
         """
-        inbox = PhotoUtils.get_inbox_directory(self.images_path, "yarn")
-        files = PhotoUtils.list_images_in_directory(inbox)
+        if files is None:
+            _, files = self._get_inbox("yarn")
 
         if not files:
             print("No files in yarn inbox.")
@@ -124,8 +163,7 @@ class InboxProcessor:
 
         for i, group in enumerate(groups, 1):
             print(f"\n--- Group {i} ({len(group)} files) ---")
-            for f in group:
-                print(f"  {f.name}")
+            print("\n".join(f"  {f.name}" for f in group))
 
             if not dry_run:
                 # In real implementation, would prompt for yarn details
@@ -134,18 +172,23 @@ class InboxProcessor:
 
         return created_ids
 
-    def process_stitch_inbox(self, dry_run: bool = True) -> List[str]:
+    def process_stitch_inbox(
+        self,
+        dry_run: bool = True,
+        files: Optional[List[Path]] = None
+    ) -> List[str]:
         """
         Process stitch inbox files.
 
         Args:
             dry_run: If True, only show what would be done.
+            files: Already-listed inbox files; scanned if not given.
 
         Returns:
             List of created stitch IDs.
         """
-        inbox = PhotoUtils.get_inbox_directory(self.images_path, "stitch")
-        files = PhotoUtils.list_images_in_directory(inbox)
+        if files is None:
+            _, files = self._get_inbox("stitch")
 
         if not files:
             print("No files in stitch inbox.")
@@ -155,29 +198,37 @@ class InboxProcessor:
 
         print(f"\nFound {len(files)} stitch reference files")
 
+        lines = []
         for f in files:
-            print(f"  {f.name}")
+            lines.append(f"  {f.name}")
 
             if not dry_run:
                 # Would analyze image to identify stitch
                 # Cross-reference with Hookfully
                 # Create or update stitch entry
-                print("  [Would identify stitch and create entry]")
+                lines.append("  [Would identify stitch and create entry]")
+
+        print("\n".join(lines))
 
         return created_ids
 
-    def process_piece_inbox(self, dry_run: bool = True) -> List[str]:
+    def process_piece_inbox(
+        self,
+        dry_run: bool = True,
+        files: Optional[List[Path]] = None
+    ) -> List[str]:
         """
         Process piece inbox files.
 
         Args:
             dry_run: If True, only show what would be done.
+            files: Already-listed inbox files; scanned if not given.
 
         Returns:
             List of created piece IDs.
         """
-        inbox = PhotoUtils.get_inbox_directory(self.images_path, "piece")
-        files = PhotoUtils.list_images_in_directory(inbox)
+        if files is None:
+            _, files = self._get_inbox("piece")
 
         if not files:
             print("No files in pieces inbox.")
@@ -192,12 +243,11 @@ class InboxProcessor:
             print(f"\n--- Piece {i} ({len(group)} photos) ---")
 
             # Extract date from first file if available
-            first_date = DateUtils.extract_date_from_filename(group[0].name)
+            first_date = _extract_date(group[0].name)
             if first_date:
                 print(f"  Date: {first_date}")
 
-            for f in group:
-                print(f"  {f.name}")
+            print("\n".join(f"  {f.name}" for f in group))
 
             if not dry_run:
                 # Would prompt for piece details
@@ -223,17 +273,17 @@ def process_inbox(entity_type: str, dry_run: bool = True) -> None:
         inboxes = processor.check_all_inboxes()
         processor.print_inbox_summary(inboxes)
 
-        for etype in inboxes.keys():
+        for etype, files in inboxes.items():
             print(f"\n{'=' * 40}")
             print(f"Processing {etype}s inbox")
             print("=" * 40)
 
             if etype == "yarn":
-                processor.process_yarn_inbox(dry_run)
+                processor.process_yarn_inbox(dry_run, files)
             elif etype == "stitch":
-                processor.process_stitch_inbox(dry_run)
+                processor.process_stitch_inbox(dry_run, files)
             elif etype == "piece":
-                processor.process_piece_inbox(dry_run)
+                processor.process_piece_inbox(dry_run, files)
 
     elif entity_type == "yarns":
         processor.process_yarn_inbox(dry_run)
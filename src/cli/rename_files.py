@@ -4,13 +4,75 @@ File renaming utilities.
 Handles batch renaming of photos according to naming conventions.
 """
 
+import os
 import re
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Callable, List, Sequence, Tuple, Optional, Union
 
 from ..utils.photo_utils import PhotoUtils
 from ..utils.date_utils import DateUtils
 
+# Files may be given as Path objects or plain path strings (e.g.
+# DirEntry.path); plans keep whatever the caller passed in
+PathLike = Union[str, os.PathLike]
+
+# Common descriptors to detect, in priority order
+_DESCRIPTOR_KEYWORDS = (
+    ("front", ("front", "main", "hero")),
+    ("back", ("back", "reverse")),
+    ("detail", ("detail", "closeup", "close-up", "macro")),
+    ("label", ("label", "tag", "brand")),
+    ("ball", ("ball", "skein")),
+    ("texture", ("texture", "swatch")),
+    ("wip", ("wip", "progress", "working")),
+    ("finished", ("finished", "done", "complete", "final")),
+    ("worn", ("worn", "wearing", "model", "mannequin")),
+    ("folded", ("folded", "flat")),
+    ("diagram", ("diagram", "chart", "pattern")),
+    ("tutorial", ("tutorial", "screenshot", "screen")),
+    ("sample", ("sample", "example")),
+    ("shop", ("shop", "store", "website", "tienda")),
+)
+
+
+def _split_name(filepath: PathLike) -> Tuple[str, str]:
+    """
+    Split a path into (stem, lowercased suffix) with the same rules as
+    Path.stem/Path.suffix, in one pass over the raw string.
+    """
+    path = os.fspath(filepath)
+    start = path.rfind(os.sep) + 1
+    if os.altsep:
+        start = max(start, path.rfind(os.altsep) + 1)
+    dot = path.rfind(".", start)
+    if start < dot < len(path) - 1:
+        return path[start:dot], path[dot:].lower()
+    return path[start:], ""
+
+
+def _build_descriptor_matcher() -> Callable[[str], Optional[str]]:
+    """
+    Generate a matcher function from _DESCRIPTOR_KEYWORDS.
+
+    The table is fixed, so it is unrolled once into a chain of
+    `if "kw" in name or ...: return "descriptor"` tests. That is faster
+    than any data-driven loop or regex over the same keywords, and
+    checking descriptors in table order keeps the existing priority.
+    """
+    lines = ["def _match_descriptor(name):"]
+    for descriptor, keywords in _DESCRIPTOR_KEYWORDS:
+        test = " or ".join(f"{keyword!r} in name" for keyword in keywords)
+        lines.append(f"    if {test}:")
+        lines.append(f"        return {descriptor!r}")
+    lines.append("    return None")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_match_descriptor"]
+
+
+_match_descriptor = _build_descriptor_matcher()
+
 
 class FileRenamer:
     """Batch file renaming operations."""
@@ -26,10 +88,10 @@ class FileRenamer:
 
     def generate_rename_plan(
         self,
-        files: List[Path],
+        files: Sequence[PathLike],
         entity_id: str,
         descriptors: Optional[List[str]] = None
-    ) -> List[Tuple[Path, str]]:
+    ) -> List[Tuple[PathLike, str]]:
         """
         Generate a rename plan for a list of files.
 
@@ -41,69 +103,60 @@ class FileRenamer:
         Returns:
             List of (source_path, new_filename) tuples.
         """
-        plan = []
-
-        for i, filepath in enumerate(files):
-            ext = filepath.suffix.lower()
-
-            if descriptors and i < len(descriptors):
-                descriptor = descriptors[i]
-            else:
-                # Generate descriptor from original filename or index
-                descriptor = self._infer_descriptor(filepath, i)
-
-            new_name = PhotoUtils.generate_photo_filename(
-                entity_id=entity_id,
-                descriptor=descriptor,
-                extension=ext,
-                index=i + 1 if len(files) > 1 else None
+        names = [_split_name(filepath) for filepath in files]
+
+        if descriptors is not None and len(descriptors) >= len(files):
+            # Every file has a caller-supplied descriptor
+            chosen = descriptors
+        else:
+            # Generate missing descriptors from original filename or index
+            chosen = [
+                descriptors[i] if descriptors and i < len(descriptors)
+                else self._infer_descriptor(filepath, i, stem.lower())
+                for i, (filepath, (stem, _)) in enumerate(zip(files, names))
+            ]
+
+        numbered = len(files) > 1
+        return [
+            (
+                filepath,
+                PhotoUtils.generate_photo_filename(
+                    entity_id=entity_id,
+                    descriptor=descriptor,
+                    extension=ext,
+                    index=i + 1 if numbered else None
+                ),
             )
+            for i, (filepath, (_, ext), descriptor) in enumerate(zip(files, names, chosen))
+        ]
 
-            plan.append((filepath, new_name))
-
-        return plan
-
-    def _infer_descriptor(self, filepath: Path, index: int) -> str:
+    def _infer_descriptor(
+        self,
+        filepath: PathLike,
+        index: int,
+        stem_lower: Optional[str] = None
+    ) -> str:
         """
         Infer a descriptor from the original filename.
 
         Args:
             filepath: Original file path.
             index: Position in the file list.
+            stem_lower: Lowercased stem, if the caller already has it.
 
         Returns:
             Inferred descriptor string.
         """
-        name = filepath.stem.lower()
-
-        # Common descriptors to detect
-        descriptor_keywords = {
-            "front": ["front", "main", "hero"],
-            "back": ["back", "reverse"],
-            "detail": ["detail", "closeup", "close-up", "macro"],
-            "label": ["label", "tag", "brand"],
-            "ball": ["ball", "skein"],
-            "texture": ["texture", "swatch"],
-            "wip": ["wip", "progress", "working"],
-            "finished": ["finished", "done", "complete", "final"],
-            "worn": ["worn", "wearing", "model", "mannequin"],
-            "folded": ["folded", "flat"],
-            "diagram": ["diagram", "chart", "pattern"],
-            "tutorial": ["tutorial", "screenshot", "screen"],
-            "sample": ["sample", "example"],
-            "shop": ["shop", "store", "website", "tienda"],
-        }
-
-        for descriptor, keywords in descriptor_keywords.items():
-            for keyword in keywords:
-                if keyword in name:
-                    return descriptor
-
-        # Default descriptors based on index
-        defaults = ["photo", "image", "pic"]
+        name = stem_lower if stem_lower is not None else Path(filepath).stem.lower()
+
+        descriptor = _match_descriptor(name)
+        if descriptor:
+            return descriptor
+
+        # Default descriptor based on index
         return f"photo{index + 1:02d}"
 
-    def preview_rename(self, plan: List[Tuple[Path, str]]) -> str:
+    def preview_rename(self, plan: List[Tuple[PathLike, str]]) -> str:
         """
         Generate a preview of the rename plan.
 
@@ -113,17 +166,17 @@ class FileRenamer:
         Returns:
             Formatted preview string.
         """
-        lines = ["Rename Plan:", "-" * 60]
-
-        for source, new_name in plan:
-            lines.append(f"  {source.name}")
-            lines.append(f"    -> {new_name}")
-
-        return "\n".join(lines)
+        # One formatted chunk per entry, joined once
+        parts = ["Rename Plan:\n" + "-" * 60]
+        parts.extend(
+            f"\n  {os.path.basename(os.fspath(source))}\n    -> {new_name}"
+            for source, new_name in plan
+        )
+        return "".join(parts)
 
     def execute_rename(
         self,
-        plan: List[Tuple[Path, str]],
+        plan: List[Tuple[PathLike, str]],
         dest_directory: Path,
         move: bool = True
     ) -> List[Path]:
@@ -138,24 +191,45 @@ class FileRenamer:
         Returns:
             List of new file paths.
         """
-        new_paths = []
-
-        for source, new_name in plan:
-            if move:
-                new_path = PhotoUtils.rename_and_move_photo(
-                    source=source,
-                    dest_directory=dest_directory,
-                    new_filename=new_name
-                )
-            else:
-                new_path = PhotoUtils.copy_photo(
-                    source=source,
-                    dest_directory=dest_directory,
-                    new_filename=new_name
-                )
-            new_paths.append(new_path)
-
-        return new_paths
+        tasks = [(source, dest_directory, new_name) for source, new_name in plan]
+        if move:
+            return PhotoUtils.bulk_move(tasks)
+        return PhotoUtils.bulk_copy(tasks)
+
+    def rename_from_inbox(
+        self,
+        inbox: Path,
+        dest: Path,
+        entity_id: str,
+        descriptors: Optional[List[str]] = None,
+        dry_run: bool = False
+    ) -> List[Path]:
+        """
+        Rename files from an already-resolved inbox to an entity folder.
+
+        Args:
+            inbox: Inbox directory to read from.
+            dest: Entity photo directory to move files into.
+            entity_id: Entity ID for naming.
+            descriptors: Optional descriptors for files.
+            dry_run: If True, only show plan without executing.
+
+        Returns:
+            List of new file paths (empty if dry_run).
+        """
+        files = sorted(entry.path for entry in PhotoUtils.iter_images_in_directory(inbox))
+
+        if not files:
+            print(f"No files found in {inbox}")
+            return []
+
+        plan = self.generate_rename_plan(files, entity_id, descriptors)
+
+        if dry_run:
+            print(self.preview_rename(plan))
+            return []
+
+        return self.execute_rename(plan, dest, move=True)
 
 
 def rename_inbox_files(
@@ -178,21 +252,8 @@ def rename_inbox_files(
     Returns:
         List of new file paths (empty if dry_run).
     """
-    renamer = FileRenamer(base_path)
-
     inbox = PhotoUtils.get_inbox_directory(base_path, entity_type)
     dest = PhotoUtils.get_entity_photo_directory(base_path, entity_id)
-
-    files = PhotoUtils.list_images_in_directory(inbox)
-
-    if not files:
-        print(f"No files found in {inbox}")
-        return []
-
-    plan = renamer.generate_rename_plan(files, entity_id, descriptors)
-
-    if dry_run:
-        print(renamer.preview_rename(plan))
-        return []
-
-    return renamer.execute_rename(plan, dest, move=True)
+    return FileRenamer(base_path).rename_from_inbox(
+        inbox, dest, entity_id, descriptors, dry_run
+    )
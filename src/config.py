@@ -4,7 +4,6 @@ Configuration settings for the Crochet Project Manager.
 
 from pathlib import Path
 from dataclasses import dataclass, field
-from decimal import Decimal
 from typing import Dict
 
 
@@ -41,28 +40,28 @@ class Config:
         return self.DATA_DIR / "styles.json"
 
     # Pricing defaults
-    HOURLY_RATE: Decimal = Decimal("8.00")
-    PROFIT_MARGIN: Decimal = Decimal("0.20")
-    MIN_MARGIN: Decimal = Decimal("0.10")
+    HOURLY_RATE: float = 8.00
+    PROFIT_MARGIN: float = 0.20
+    MIN_MARGIN: float = 0.10
     PRICE_ROUND_TO: int = 5
 
     # Stitch complexity factors by category
-    STITCH_COMPLEXITY: Dict[str, Decimal] = field(default_factory=lambda: {
-        "basic": Decimal("1.0"),
-        "textured": Decimal("1.15"),
-        "lace": Decimal("1.25"),
-        "colorwork": Decimal("1.30"),
-        "specialty": Decimal("1.40"),
+    STITCH_COMPLEXITY: Dict[str, float] = field(default_factory=lambda: {
+        "basic": 1.0,
+        "textured": 1.15,
+        "lace": 1.25,
+        "colorwork": 1.30,
+        "specialty": 1.40,
     })
 
     # Size factors by piece type
-    SIZE_FACTORS: Dict[str, Decimal] = field(default_factory=lambda: {
-        "hat": Decimal("0.8"),
-        "cowl": Decimal("0.9"),
-        "scarf": Decimal("1.0"),
-        "shawl": Decimal("1.2"),
-        "blanket": Decimal("1.5"),
-        "other": Decimal("1.0"),
+    SIZE_FACTORS: Dict[str, float] = field(default_factory=lambda: {
+        "hat": 0.8,
+        "cowl": 0.9,
+        "scarf": 1.0,
+        "shawl": 1.2,
+        "blanket": 1.5,
+        "other": 1.0,
     })
 
     # ID formats
@@ -5,9 +5,11 @@ Piece data model.
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 from enum import Enum
 
+from .serialization import ModelCodec
+
 
 class WorkStatus(Enum):
     """Work progress status."""
@@ -41,7 +43,7 @@ class PieceType(Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkSession:
     """A single work session on a piece."""
     date: date
@@ -64,7 +66,7 @@ class WorkSession:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Dimensions:
     """Piece dimensions."""
     width_cm: Optional[float] = None
@@ -89,7 +91,7 @@ class Dimensions:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Piece:
     """A crochet piece (finished or in progress)."""
 
@@ -98,9 +100,11 @@ class Piece:
     type: str
     work_status: str
     destination: str
-    stitches_used: List[str] = field(default_factory=list)
-    yarns_used: List[str] = field(default_factory=list)
-    photos: List[str] = field(default_factory=list)
+    # ID/photo lists load as-is from JSON and default to a shared empty
+    # tuple; rebind to a new list rather than mutating in place
+    stitches_used: Sequence[str] = ()
+    yarns_used: Sequence[str] = ()
+    photos: Sequence[str] = ()
 
     # Optional fields
     dimensions: Optional[Dimensions] = None
@@ -128,75 +132,77 @@ class Piece:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    # Cached result of calculate_total_hours (not serialized)
+    _total_hours_cache: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def calculate_total_hours(self) -> float:
-        """Calculate total hours from work sessions."""
-        if self.work_sessions:
-            return sum(session.hours for session in self.work_sessions)
-        return self.work_hours or 0.0
+        """
+        Calculate total hours from work sessions.
+
+        The result is cached; use add_session() to log work, or call
+        invalidate_hours() after changing sessions or work_hours directly.
+        """
+        if self._total_hours_cache is None:
+            if self.work_sessions:
+                self._total_hours_cache = sum(session.hours for session in self.work_sessions)
+            else:
+                self._total_hours_cache = self.work_hours or 0.0
+        return self._total_hours_cache
+
+    def add_session(self, session: WorkSession) -> None:
+        """Log a work session and refresh the cached total."""
+        self.work_sessions.append(session)
+        self._total_hours_cache = None
+
+    def invalidate_hours(self) -> None:
+        """Drop the cached total hours."""
+        self._total_hours_cache = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "type": self.type,
-            "work_status": self.work_status,
-            "destination": self.destination,
-            "dimensions": self.dimensions.to_dict() if self.dimensions else None,
-            "date_started": self.date_started.isoformat() if self.date_started else None,
-            "date_finished": self.date_finished.isoformat() if self.date_finished else None,
-            "work_hours": self.work_hours,
-            "work_sessions": [s.to_dict() for s in self.work_sessions],
-            "hook_size_mm": self.hook_size_mm,
-            "photos": self.photos,
-            "price": float(self.price) if self.price else None,
-            "suggested_price": float(self.suggested_price) if self.suggested_price else None,
-            "material_cost": float(self.material_cost) if self.material_cost else None,
-            "gift_recipient": self.gift_recipient,
-            "sale_platform": self.sale_platform,
-            "sale_link": self.sale_link,
-            "sold_date": self.sold_date.isoformat() if self.sold_date else None,
-            "sold_price": float(self.sold_price) if self.sold_price else None,
-            "yarns_used": self.yarns_used,
-            "stitches_used": self.stitches_used,
-            "notes": self.notes,
-            "archived": self.archived,
-            "archived_date": self.archived_date.isoformat() if self.archived_date else None,
-            "archived_reason": self.archived_reason,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        return _CODEC.to_dict(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Piece":
         """Create from dictionary (JSON data)."""
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            type=data["type"],
-            work_status=data.get("work_status", "in_progress"),
-            destination=data.get("destination", "for_sale"),
-            dimensions=Dimensions.from_dict(data.get("dimensions")),
-            date_started=date.fromisoformat(data["date_started"]) if data.get("date_started") else None,
-            date_finished=date.fromisoformat(data["date_finished"]) if data.get("date_finished") else None,
-            work_hours=data.get("work_hours"),
-            work_sessions=[WorkSession.from_dict(s) for s in data.get("work_sessions", [])],
-            hook_size_mm=data.get("hook_size_mm"),
-            photos=data.get("photos", []),
-            price=Decimal(str(data["price"])) if data.get("price") else None,
-            suggested_price=Decimal(str(data["suggested_price"])) if data.get("suggested_price") else None,
-            material_cost=Decimal(str(data["material_cost"])) if data.get("material_cost") else None,
-            gift_recipient=data.get("gift_recipient"),
-            sale_platform=data.get("sale_platform"),
-            sale_link=data.get("sale_link"),
-            sold_date=date.fromisoformat(data["sold_date"]) if data.get("sold_date") else None,
-            sold_price=Decimal(str(data["sold_price"])) if data.get("sold_price") else None,
-            yarns_used=data.get("yarns_used", []),
-            stitches_used=data.get("stitches_used", []),
-            notes=data.get("notes"),
-            archived=data.get("archived", False),
-            archived_date=date.fromisoformat(data["archived_date"]) if data.get("archived_date") else None,
-            archived_reason=data.get("archived_reason"),
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
-            updated_at=datetime.fromisoformat(data["updated_at"]) if data.get("updated_at") else None,
-        )
+        return _CODEC.from_dict(data)
+
+
+# Key order matches the JSON data files
+_CODEC = ModelCodec(
+    Piece,
+    field_order=(
+        "id",
+        "name",
+        "type",
+        "work_status",
+        "destination",
+        "dimensions",
+        "date_started",
+        "date_finished",
+        "work_hours",
+        "work_sessions",
+        "hook_size_mm",
+        "photos",
+        "price",
+        "suggested_price",
+        "material_cost",
+        "gift_recipient",
+        "sale_platform",
+        "sale_link",
+        "sold_date",
+        "sold_price",
+        "yarns_used",
+        "stitches_used",
+        "notes",
+        "archived",
+        "archived_date",
+        "archived_reason",
+        "created_at",
+        "updated_at",
+    ),
+    json_defaults={"work_status": "in_progress", "destination": "for_sale"},
+    interned=("type", "work_status", "destination"),
+)
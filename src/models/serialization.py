@@ -0,0 +1,152 @@
+"""
+Field-driven JSON conversion for the entity models.
+
+Builds the per-field to_dict/from_dict conversions once from each
+dataclass's type annotations, instead of spelling out every field by hand.
+"""
+
+import dataclasses
+import sys
+from collections import abc
+from datetime import date, datetime
+from decimal import Decimal
+from typing import (
+    Any, Callable, Dict, List, Optional, Sequence, Tuple, Union,
+    get_args, get_origin, get_type_hints,
+)
+
+Encoder = Optional[Callable[[Any], Any]]
+Decoder = Callable[[Dict[str, Any]], Any]
+
+
+def _unwrap_optional(hint: Any) -> Any:
+    """Return X for Optional[X], otherwise the hint unchanged."""
+    if get_origin(hint) is Union:
+        args = [a for a in get_args(hint) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return hint
+
+
+def _list_item_type(hint: Any) -> Optional[Any]:
+    """Return X for List[X] or Sequence[X], or None if not a sequence."""
+    if get_origin(hint) in (list, List, abc.Sequence):
+        args = get_args(hint)
+        return args[0] if args else Any
+    return None
+
+
+def _is_model(hint: Any) -> bool:
+    """True for nested models that serialize themselves."""
+    return isinstance(hint, type) and hasattr(hint, "to_dict") and hasattr(hint, "from_dict")
+
+
+def _encoder(hint: Any) -> Encoder:
+    """Build the value -> JSON conversion for a field, or None for as-is."""
+    hint = _unwrap_optional(hint)
+    item = _list_item_type(hint)
+
+    if item is not None:
+        if _is_model(item):
+            return lambda v: [i.to_dict() for i in v]
+        # Saved records are kept in DataService's file cache, so they get
+        # their own list rather than the model's (possibly mutable) one
+        return lambda v: None if v is None else list(v)
+    if hint is datetime or hint is date:
+        return lambda v: v.isoformat() if v else None
+    if hint is Decimal:
+        return lambda v: float(v) if v else None
+    if _is_model(hint):
+        return lambda v: v.to_dict() if v else None
+    return None
+
+
+def _decoder(field: dataclasses.Field, hint: Any, json_default: Any) -> Decoder:
+    """Build the JSON -> value conversion for a field."""
+    name = field.name
+    hint = _unwrap_optional(hint)
+    item = _list_item_type(hint)
+
+    if item is not None:
+        if _is_model(item):
+            return lambda d: [item.from_dict(i) for i in d.get(name, [])]
+        # Loaded lists may be shared with a cache of parsed files, so the
+        # model always gets its own sequence
+        if field.default is not dataclasses.MISSING:
+            # Immutable default (e.g. an empty tuple): decode to a tuple too
+            default = field.default
+            return lambda d: tuple(v) if isinstance(v := d.get(name, default), list) else v
+        factory = field.default_factory
+        return lambda d: v.copy() if isinstance(v := d.get(name), list) else (v if name in d else factory())
+    # Nullable scalars: a single key lookup, then convert if set
+    if hint is datetime or hint is date:
+        parse = hint.fromisoformat
+        return lambda d: parse(v) if (v := d.get(name)) else None
+    if hint is Decimal:
+        return lambda d: Decimal(str(v)) if (v := d.get(name)) else None
+    if _is_model(hint):
+        return lambda d: hint.from_dict(d.get(name))
+
+    if json_default is not dataclasses.MISSING:
+        return lambda d: d.get(name, json_default)
+    if field.default is not dataclasses.MISSING:
+        default = field.default
+        return lambda d: d.get(name, default)
+    return lambda d: d[name]
+
+
+def _interned(decode: Decoder) -> Decoder:
+    """Wrap a string decoder so equal values share one interned object."""
+    intern = sys.intern
+    return lambda d: intern(v) if isinstance(v := decode(d), str) else v
+
+
+class ModelCodec:
+    """Precomputed to_dict/from_dict conversions for one dataclass."""
+
+    def __init__(
+        self,
+        cls: type,
+        field_order: Sequence[str],
+        json_defaults: Optional[Dict[str, Any]] = None,
+        interned: Sequence[str] = ()
+    ):
+        """
+        Build the codec.
+
+        Args:
+            cls: Dataclass to convert.
+            field_order: Field names in serialized key order.
+            json_defaults: Values for required fields missing from JSON.
+            interned: Low-cardinality string fields to intern on load.
+        """
+        hints = get_type_hints(cls)
+        # Fields excluded from __init__ are derived state, not data
+        fields = {f.name: f for f in dataclasses.fields(cls) if f.init}
+        if set(field_order) != set(fields):
+            raise ValueError(f"field_order does not match fields of {cls.__name__}")
+
+        json_defaults = json_defaults or {}
+        self.cls = cls
+        self._encoders: Tuple[Tuple[str, Encoder], ...] = tuple(
+            (name, _encoder(hints[name])) for name in field_order
+        )
+        decoders = []
+        for name in field_order:
+            decode = _decoder(fields[name], hints[name], json_defaults.get(name, dataclasses.MISSING))
+            if name in interned:
+                decode = _interned(decode)
+            decoders.append((name, decode))
+        self._decoders: Tuple[Tuple[str, Decoder], ...] = tuple(decoders)
+
+    def to_dict(self, obj: Any) -> Dict[str, Any]:
+        """Convert a model instance to a JSON-ready dictionary."""
+        result = {}
+        for name, encode in self._encoders:
+            value = getattr(obj, name)
+            result[name] = value if encode is None else encode(value)
+        return result
+
+    def from_dict(self, data: Dict[str, Any]) -> Any:
+        """Create a model instance from a JSON dictionary."""
+        return self.cls(**{name: decode(data) for name, decode in self._decoders})
@@ -2,11 +2,14 @@
 Stitch data model.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import date, datetime
-from typing import List, Optional, Dict, Any
+from typing import Optional, Dict, Any, Sequence
 from enum import Enum
 
+from ..config import config
+from .serialization import ModelCodec
+
 
 class StitchCategory(Enum):
     """Stitch categories."""
@@ -24,17 +27,17 @@ class Difficulty(Enum):
     ADVANCED = "advanced"
 
 
-@dataclass
+@dataclass(slots=True)
 class Stitch:
     """A crochet stitch/technique."""
 
     id: str
     name: str
     description: str
-    photos: List[str] = field(default_factory=list)
+    photos: Sequence[str] = ()  # Shared empty default; rebind, don't mutate
 
     # Optional fields
-    name_aliases: List[str] = field(default_factory=list)
+    name_aliases: Sequence[str] = ()
     name_es: Optional[str] = None
     abbreviation: Optional[str] = None
     category: Optional[str] = None
@@ -55,54 +58,42 @@ class Stitch:
 
     def get_complexity_factor(self) -> float:
         """Get complexity factor based on category."""
-        from ..config import config
-
         category = self.category or "basic"
-        return float(config.STITCH_COMPLEXITY.get(category, config.STITCH_COMPLEXITY["basic"]))
+        return config.STITCH_COMPLEXITY.get(category, config.STITCH_COMPLEXITY["basic"])
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "name_aliases": self.name_aliases,
-            "name_es": self.name_es,
-            "abbreviation": self.abbreviation,
-            "category": self.category,
-            "difficulty": self.difficulty,
-            "description": self.description,
-            "hookfully_link": self.hookfully_link,
-            "instruction_link": self.instruction_link,
-            "video_link": self.video_link,
-            "photos": self.photos,
-            "notes": self.notes,
-            "archived": self.archived,
-            "archived_date": self.archived_date.isoformat() if self.archived_date else None,
-            "archived_reason": self.archived_reason,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        return _CODEC.to_dict(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Stitch":
         """Create from dictionary (JSON data)."""
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            name_aliases=data.get("name_aliases", []),
-            name_es=data.get("name_es"),
-            abbreviation=data.get("abbreviation"),
-            category=data.get("category"),
-            difficulty=data.get("difficulty"),
-            description=data.get("description", ""),
-            hookfully_link=data.get("hookfully_link"),
-            instruction_link=data.get("instruction_link"),
-            video_link=data.get("video_link"),
-            photos=data.get("photos", []),
-            notes=data.get("notes"),
-            archived=data.get("archived", False),
-            archived_date=date.fromisoformat(data["archived_date"]) if data.get("archived_date") else None,
-            archived_reason=data.get("archived_reason"),
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
-            updated_at=datetime.fromisoformat(data["updated_at"]) if data.get("updated_at") else None,
-        )
+        return _CODEC.from_dict(data)
+
+
+# Key order matches the JSON data files
+_CODEC = ModelCodec(
+    Stitch,
+    field_order=(
+        "id",
+        "name",
+        "name_aliases",
+        "name_es",
+        "abbreviation",
+        "category",
+        "difficulty",
+        "description",
+        "hookfully_link",
+        "instruction_link",
+        "video_link",
+        "photos",
+        "notes",
+        "archived",
+        "archived_date",
+        "archived_reason",
+        "created_at",
+        "updated_at",
+    ),
+    json_defaults={"description": ""},
+    interned=("category", "difficulty"),
+)
@@ -2,12 +2,14 @@
 Yarn data model.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Optional, Dict, Any
+from typing import Optional, Dict, Any, Sequence
 from enum import Enum
 
+from .serialization import ModelCodec
+
 
 class Material(Enum):
     """Primary yarn materials."""
@@ -31,7 +33,7 @@ class WeightCategory(Enum):
     SUPER_BULKY = "super_bulky"
 
 
-@dataclass
+@dataclass(slots=True)
 class CareInstructions:
     """Yarn care instructions."""
     wash_temp: Optional[str] = None
@@ -68,7 +70,7 @@ class CareInstructions:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Yarn:
     """A yarn in inventory."""
 
@@ -76,7 +78,7 @@ class Yarn:
     name: str
     color: str
     material: str
-    photos: List[str] = field(default_factory=list)
+    photos: Sequence[str] = ()  # Shared empty default; rebind, don't mutate
 
     # Optional fields
     brand: Optional[str] = None
@@ -108,65 +110,46 @@ class Yarn:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "brand": self.brand,
-            "color": self.color,
-            "color_code": self.color_code,
-            "material": self.material,
-            "material_composition": self.material_composition,
-            "material_specs": self.material_specs,
-            "weight_category": self.weight_category,
-            "ball_weight_g": self.ball_weight_g,
-            "ball_length_m": self.ball_length_m,
-            "price_paid": float(self.price_paid) if self.price_paid else None,
-            "purchase_location": self.purchase_location,
-            "purchase_link": self.purchase_link,
-            "purchase_date": self.purchase_date.isoformat() if self.purchase_date else None,
-            "quantity_owned": self.quantity_owned,
-            "hook_size_mm": self.hook_size_mm,
-            "needle_size_mm": self.needle_size_mm,
-            "gauge": self.gauge,
-            "care_instructions": self.care_instructions.to_dict() if self.care_instructions else None,
-            "photos": self.photos,
-            "notes": self.notes,
-            "archived": self.archived,
-            "archived_date": self.archived_date.isoformat() if self.archived_date else None,
-            "archived_reason": self.archived_reason,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        return _CODEC.to_dict(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Yarn":
         """Create from dictionary (JSON data)."""
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            brand=data.get("brand"),
-            color=data["color"],
-            color_code=data.get("color_code"),
-            material=data.get("material", "blend"),
-            material_composition=data.get("material_composition"),
-            material_specs=data.get("material_specs"),
-            weight_category=data.get("weight_category"),
-            ball_weight_g=data.get("ball_weight_g"),
-            ball_length_m=data.get("ball_length_m"),
-            price_paid=Decimal(str(data["price_paid"])) if data.get("price_paid") else None,
-            purchase_location=data.get("purchase_location"),
-            purchase_link=data.get("purchase_link"),
-            purchase_date=date.fromisoformat(data["purchase_date"]) if data.get("purchase_date") else None,
-            quantity_owned=data.get("quantity_owned", 1),
-            hook_size_mm=data.get("hook_size_mm"),
-            needle_size_mm=data.get("needle_size_mm"),
-            gauge=data.get("gauge"),
-            care_instructions=CareInstructions.from_dict(data.get("care_instructions")),
-            photos=data.get("photos", []),
-            notes=data.get("notes"),
-            archived=data.get("archived", False),
-            archived_date=date.fromisoformat(data["archived_date"]) if data.get("archived_date") else None,
-            archived_reason=data.get("archived_reason"),
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
-            updated_at=datetime.fromisoformat(data["updated_at"]) if data.get("updated_at") else None,
-        )
+        return _CODEC.from_dict(data)
+
+
+# Key order matches the JSON data files
+_CODEC = ModelCodec(
+    Yarn,
+    field_order=(
+        "id",
+        "name",
+        "brand",
+        "color",
+        "color_code",
+        "material",
+        "material_composition",
+        "material_specs",
+        "weight_category",
+        "ball_weight_g",
+        "ball_length_m",
+        "price_paid",
+        "purchase_location",
+        "purchase_link",
+        "purchase_date",
+        "quantity_owned",
+        "hook_size_mm",
+        "needle_size_mm",
+        "gauge",
+        "care_instructions",
+        "photos",
+        "notes",
+        "archived",
+        "archived_date",
+        "archived_reason",
+        "created_at",
+        "updated_at",
+    ),
+    json_defaults={"material": "blend"},
+    interned=("material", "weight_category"),
+)
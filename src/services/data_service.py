@@ -3,9 +3,16 @@ Data service for JSON CRUD operations.
 """
 
 import json
+import mmap
+import os
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Dict, Any, TypeVar, Type
+from typing import List, Optional, Dict, Any, Tuple, TypeVar, Type
+
+try:
+    import orjson
+except ImportError:  # Optional dependency; fall back to stdlib json
+    orjson = None
 
 from ..config import config
 from ..models.piece import Piece
@@ -15,58 +22,388 @@ from ..models.stitch import Stitch
 T = TypeVar("T", Piece, Yarn, Stitch)
 
 
+Record = Dict[str, Any]
+# Cached records list, id -> position map, highest ID number in use
+RecordIndex = Tuple[List[Record], Dict[str, int], int]
+# Cached piece records, positions by piece type, positions by stitch ID
+PieceGroups = Tuple[List[Record], Dict[str, List[int]], Dict[str, List[int]]]
+# (type, work_status, total hours) of one piece
+PieceHours = Tuple[str, str, float]
+
+# Files at least this large are parsed straight from a memory map
+MMAP_THRESHOLD = 256 * 1024
+
+# Journaled records after which the journal is folded into its JSON file
+JOURNAL_COMPACT_ENTRIES = 100
+
+Fingerprint = Tuple[int, int]
+
+
 class DataService:
     """CRUD operations for JSON data files."""
 
-    def __init__(self, config_override=None):
+    # Entity type -> (config attribute of its file, list key in the file)
+    _ENTITIES = {
+        "piece": ("PIECES_FILE", "pieces"),
+        "yarn": ("YARNS_FILE", "yarns"),
+        "stitch": ("STITCHES_FILE", "stitches"),
+    }
+
+    def __init__(self, config_override=None, journal: bool = False):
+        """
+        Initialize the service.
+
+        Args:
+            config_override: Config to use instead of the global one.
+            journal: Append created and updated records to a "<name>.jsonl"
+                journal next to each data file instead of rewriting the
+                whole file. Off by default, as the JSON files are also
+                edited by hand. Pending entries are folded back by
+                compact(), once the journal grows large, and by the next
+                DataService to load the file.
+        """
         self.config = config_override or config
+        self._journal = journal
+        # Parsed file contents keyed by path, tagged with the fingerprints
+        # of the file and of its journal
+        self._cache: Dict[Path, Tuple[Tuple[Fingerprint, Optional[Fingerprint]], Dict[str, Any]]] = {}
+        # Journaled records not yet folded into each data file
+        self._journal_entries: Dict[Path, int] = {}
+        # Lookup indexes keyed by entity type, tied to the cached records
+        self._indexes: Dict[str, RecordIndex] = {}
+        # Decoded id -> model maps, tied to the cached records like the index
+        self._by_id: Dict[str, Tuple[List[Record], Dict[str, Any]]] = {}
+        # Reverse indexes over the cached piece records
+        self._piece_groups: Optional[PieceGroups] = None
+        # Hours summary of each cached piece record
+        self._piece_hours: Optional[Tuple[List[Record], List[PieceHours]]] = None
 
     # --- Generic Methods ---
 
+    @staticmethod
+    def _fingerprint(filepath: Path) -> Fingerprint:
+        """File modification time and size, used to detect outside edits."""
+        st = filepath.stat()
+        return (st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def _journal_path(filepath: Path) -> Path:
+        """Journal of a data file, e.g. pieces.jsonl for pieces.json."""
+        return filepath.with_suffix(".jsonl")
+
+    @classmethod
+    def _fingerprints(cls, filepath: Path) -> Tuple[Fingerprint, Optional[Fingerprint]]:
+        """Fingerprints of a data file and of its journal (None if absent)."""
+        try:
+            journal = cls._fingerprint(cls._journal_path(filepath))
+        except FileNotFoundError:
+            journal = None
+        return (cls._fingerprint(filepath), journal)
+
+    def _read_json(self, filepath: Path, size: int) -> Dict[str, Any]:
+        """Read and parse a JSON file of the given size from disk."""
+        if orjson is not None:
+            with open(filepath, "rb") as f:
+                if size < MMAP_THRESHOLD:
+                    return orjson.loads(f.read())
+                # Parse from the mapped pages instead of a bytes copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+        with open(filepath, "r", encoding="utf-8") as f:
+            return json.load(f)
+
     def _load_json(self, filepath: Path) -> Dict[str, Any]:
-        """Load JSON file."""
+        """
+        Load JSON file.
+
+        Parsed contents are cached until the file changes on disk. The
+        returned dict and its "_meta" entry are fresh copies, so callers
+        may replace top-level keys; the records themselves are shared
+        with the cache and must not be mutated in place. Models never hold
+        the cached lists: from_dict and to_dict copy sequence fields.
+        """
         if not filepath.exists():
             return {"_meta": {"next_id": 1, "last_updated": datetime.now().isoformat()}}
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
 
-    def _save_json(self, filepath: Path, data: Dict[str, Any]) -> None:
-        """Save JSON file."""
-        data["_meta"]["last_updated"] = datetime.now().isoformat()
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        fingerprint = self._fingerprints(filepath)
+        cached = self._cache.get(filepath)
+        if cached is None or cached[0] != fingerprint:
+            file_data = self._read_json(filepath, fingerprint[0][1])
+            pending = self._replay_journal(filepath, file_data) if fingerprint[1] else 0
+            # Pending entries are folded in on the first load, and on every
+            # load when this service does not journal itself
+            if pending and (not self._journal or filepath not in self._journal_entries):
+                self._save_json(filepath, file_data)
+                cached = self._cache[filepath]
+            else:
+                self._journal_entries[filepath] = pending
+                cached = (fingerprint, file_data)
+                self._cache[filepath] = cached
+
+        data = dict(cached[1])
+        if "_meta" in data:
+            data["_meta"] = dict(data["_meta"])
+        return data
+
+    def _save_json(self, filepath: Path, data: Dict[str, Any], now: Optional[datetime] = None) -> None:
+        """
+        Save JSON file.
+
+        The data is written to a temporary file next to the target, which
+        then replaces it, so an interrupted save never leaves a truncated
+        file behind.
+
+        Args:
+            filepath: File to write.
+            data: File contents.
+            now: Timestamp for "_meta.last_updated" (default: current time).
+        """
+        # Not every data file ships with a "_meta" block
+        data.setdefault("_meta", {})["last_updated"] = (now or datetime.now()).isoformat()
+        if orjson is not None:
+            # Same layout as json.dump(indent=2, ensure_ascii=False)
+            buf = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            buf = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+        tmp_path = filepath.with_suffix(filepath.suffix + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(buf)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        # The file now holds everything the journal did; replaying a journal
+        # left over by a crash here is harmless, as entries replace by ID
+        self._journal_path(filepath).unlink(missing_ok=True)
+        self._journal_entries[filepath] = 0
+
+        # What was just written is the new file content
+        self._cache[filepath] = (self._fingerprints(filepath), data)
+
+    @staticmethod
+    def _journal_line(entry: Dict[str, Any]) -> bytes:
+        """Encode one journal entry as a single line."""
+        if orjson is not None:
+            return orjson.dumps(entry) + b"\n"
+        return json.dumps(entry, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    def _replay_journal(self, filepath: Path, data: Dict[str, Any]) -> int:
+        """
+        Apply a data file's journal onto its freshly read contents.
+
+        Each journal line maps a list key to one record, which replaces the
+        record with the same ID or is appended if the ID is new, and
+        "_meta" to the file metadata as of that change.
+
+        Returns:
+            Number of entries applied.
+        """
+        loads = orjson.loads if orjson is not None else json.loads
+        positions: Dict[str, Dict[str, int]] = {}
+        count = 0
+        with open(self._journal_path(filepath), "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = loads(line)
+                except ValueError:
+                    break  # Torn last line of an interrupted append
+                for key, record in entry.items():
+                    if key == "_meta":
+                        # Keeps next_id and last_updated in step with the records
+                        data.setdefault("_meta", {}).update(record)
+                        continue
+                    records = data.setdefault(key, [])
+                    index = positions.get(key)
+                    if index is None:
+                        index = positions[key] = {}
+                        for i, item in enumerate(records):
+                            index.setdefault(item.get("id"), i)
+                    i = index.get(record.get("id"))
+                    if i is None:
+                        index[record.get("id")] = len(records)
+                        records.append(record)
+                    else:
+                        records[i] = record
+                count += 1
+        return count
+
+    def _append_journal(
+        self,
+        filepath: Path,
+        key: str,
+        record: Record,
+        data: Dict[str, Any],
+        now: datetime
+    ) -> None:
+        """
+        Persist one created or updated record.
+
+        The record and the file's "_meta" block (next_id, last_updated)
+        are appended to the journal when journaling is on;
+        otherwise, or when the journal is due for compaction or the file
+        does not exist yet, the whole file is saved.
+
+        Args:
+            filepath: Data file the record belongs to.
+            key: List key of the record in the file.
+            record: Serialized record.
+            data: Full file contents including the record.
+            now: Timestamp of the change.
+        """
+        pending = self._journal_entries.get(filepath, 0)
+        if not self._journal or pending + 1 >= JOURNAL_COMPACT_ENTRIES or not filepath.exists():
+            self._save_json(filepath, data, now)
+            return
+
+        meta = data.setdefault("_meta", {})
+        meta["last_updated"] = now.isoformat()
+        with open(self._journal_path(filepath), "ab") as f:
+            f.write(self._journal_line({key: record, "_meta": meta}))
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_entries[filepath] = pending + 1
+        self._cache[filepath] = (self._fingerprints(filepath), data)
+
+    def compact(self) -> None:
+        """Fold pending journal entries back into the JSON data files."""
+        for attr, _ in self._ENTITIES.values():
+            filepath = getattr(self.config, attr)
+            if self._journal_path(filepath).exists():
+                data = self._load_json(filepath)
+                # Loading may already have folded the journal in
+                if self._journal_path(filepath).exists():
+                    self._save_json(filepath, data)
+
+    def _entity_file(self, entity_type: str) -> Tuple[Path, str]:
+        """Data file and list key for an entity type."""
+        try:
+            attr, key = self._ENTITIES[entity_type]
+        except KeyError:
+            raise ValueError(f"Unknown entity type: {entity_type}") from None
+        return getattr(self.config, attr), key
+
+    @staticmethod
+    def _id_number(item_id: str, prefix: str) -> int:
+        """Numeric part of an ID like PIECE-007, or 0 if it has none."""
+        if item_id.startswith(prefix):
+            try:
+                return int(item_id.split("-")[1])
+            except (IndexError, ValueError):
+                pass
+        return 0
+
+    def _index(self, entity_type: str) -> Tuple[Dict[str, Any], RecordIndex]:
+        """
+        Load an entity file together with its lookup index.
+
+        The index is rebuilt only when the cached records list has been
+        replaced, i.e. after the file changed on disk or was saved.
+
+        Returns:
+            Tuple of (file data, index).
+        """
+        filepath, key = self._entity_file(entity_type)
+        data = self._load_json(filepath)
+        records = data.get(key, [])
+        index = self._indexes.get(entity_type)
+        if index is None or index[0] is not records:
+            prefix = entity_type.upper() + "-"
+            positions: Dict[str, int] = {}
+            max_num = 0
+            for i, item in enumerate(records):
+                item_id = item.get("id", "")
+                # First record wins on duplicate IDs, as with a linear scan
+                positions.setdefault(item_id, i)
+                max_num = max(max_num, self._id_number(item_id, prefix))
+            index = (records, positions, max_num)
+            self._indexes[entity_type] = index
+        return data, index
 
     def _get_next_id(self, entity_type: str) -> str:
         """Get next sequential ID for entity type."""
-        if entity_type == "piece":
-            data = self._load_json(self.config.PIECES_FILE)
-            key = "pieces"
-        elif entity_type == "yarn":
-            data = self._load_json(self.config.YARNS_FILE)
-            key = "yarns"
-        elif entity_type == "stitch":
-            data = self._load_json(self.config.STITCHES_FILE)
-            key = "stitches"
+        data, (_, _, max_num) = self._index(entity_type)
+        return self.config.ID_PATTERNS[entity_type].format(self._next_number(data, max_num))
+
+    @staticmethod
+    def _next_number(data: Dict[str, Any], max_num: int) -> int:
+        """
+        Next free ID number of a file.
+
+        "_meta.next_id" is the stored counter, so numbers of removed records
+        are not handed out again. The highest number in use still wins if
+        the counter is missing or behind, e.g. after editing the file by hand.
+        """
+        next_id = data.get("_meta", {}).get("next_id")
+        if not isinstance(next_id, int) or next_id <= max_num:
+            return max_num + 1
+        return next_id
+
+    def _get_by_id(self, entity_type: str, model: Type[T], entity_id: str) -> Optional[T]:
+        """Get a single entity by ID."""
+        _, (records, positions, _) = self._index(entity_type)
+        i = positions.get(entity_id)
+        return model.from_dict(records[i]) if i is not None else None
+
+    def _load_by_id(self, entity_type: str, model: Type[T]) -> Dict[str, T]:
+        """
+        Map every entity ID to its model, archived ones included.
+
+        The decoded map is kept until the file changes, so the model
+        objects are shared between calls and must be treated as read-only.
+        """
+        _, (records, positions, _) = self._index(entity_type)
+        cached = self._by_id.get(entity_type)
+        if cached is None or cached[0] is not records:
+            cached = (records, {eid: model.from_dict(records[i]) for eid, i in positions.items()})
+            self._by_id[entity_type] = cached
+        return dict(cached[1])
+
+    def _create(self, entity_type: str, entity: T) -> str:
+        """Append a new entity record and save. Returns the assigned ID."""
+        if not entity.id:
+            entity.id = self._get_next_id(entity_type)
+        # One timestamp for the record and the file metadata
+        now = datetime.now()
+        entity.created_at = now
+        entity.updated_at = now
+
+        filepath, key = self._entity_file(entity_type)
+        data, (records, positions, max_num) = self._index(entity_type)
+        records = [*records, entity.to_dict()]
+        data[key] = records
+        number = self._id_number(entity.id, entity_type.upper() + "-")
+        next_id = max(self._next_number(data, max_num), number + 1)
+        data.setdefault("_meta", {})["next_id"] = next_id
+        self._append_journal(filepath, key, records[-1], data, now)
+
+        # Extend the index in step with the saved list instead of rescanning
+        positions.setdefault(entity.id, len(records) - 1)
+        self._indexes[entity_type] = (records, positions, max(max_num, number))
+        return entity.id
+
+    def _update(self, entity_type: str, entity: T) -> None:
+        """Replace an existing entity record and save."""
+        now = datetime.now()
+        entity.updated_at = now
+        filepath, key = self._entity_file(entity_type)
+        data, (records, positions, max_num) = self._index(entity_type)
+        records = list(records)
+        i = positions.get(entity.id)
+        data[key] = records
+        if i is not None:
+            records[i] = entity.to_dict()
+            self._append_journal(filepath, key, records[i], data, now)
         else:
-            raise ValueError(f"Unknown entity type: {entity_type}")
-
-        items = data.get(key, [])
-        if not items:
-            return self.config.ID_PATTERNS[entity_type].format(1)
-
-        # Find max ID
-        max_num = 0
-        prefix = entity_type.upper() + "-"
-        for item in items:
-            item_id = item.get("id", "")
-            if item_id.startswith(prefix):
-                try:
-                    num = int(item_id.split("-")[1])
-                    max_num = max(max_num, num)
-                except (IndexError, ValueError):
-                    pass
-
-        return self.config.ID_PATTERNS[entity_type].format(max_num + 1)
+            self._save_json(filepath, data, now)
+        # Positions are unchanged by an in-place replacement
+        self._indexes[entity_type] = (records, positions, max_num)
 
     # --- Pieces ---
 
@@ -86,33 +423,70 @@ class DataService:
 
     def get_piece_by_id(self, piece_id: str) -> Optional[Piece]:
         """Get a single piece by ID."""
-        pieces = self.load_pieces(include_archived=True)
-        for piece in pieces:
-            if piece.id == piece_id:
-                return piece
-        return None
+        return self._get_by_id("piece", Piece, piece_id)
 
     def create_piece(self, piece: Piece) -> str:
         """Create a new piece. Returns the assigned ID."""
-        if not piece.id:
-            piece.id = self._get_next_id("piece")
-        piece.created_at = datetime.now()
-        piece.updated_at = datetime.now()
-
-        pieces = self.load_pieces(include_archived=True)
-        pieces.append(piece)
-        self.save_pieces(pieces)
-        return piece.id
+        return self._create("piece", piece)
 
     def update_piece(self, piece: Piece) -> None:
         """Update an existing piece."""
-        piece.updated_at = datetime.now()
-        pieces = self.load_pieces(include_archived=True)
-        for i, p in enumerate(pieces):
-            if p.id == piece.id:
-                pieces[i] = piece
-                break
-        self.save_pieces(pieces)
+        self._update("piece", piece)
+
+    def _groups(self) -> PieceGroups:
+        """Piece record positions grouped by type and by stitch used."""
+        data = self._load_json(self.config.PIECES_FILE)
+        records = data.get("pieces", [])
+        groups = self._piece_groups
+        if groups is None or groups[0] is not records:
+            by_type: Dict[str, List[int]] = {}
+            by_stitch: Dict[str, List[int]] = {}
+            for i, record in enumerate(records):
+                by_type.setdefault(record.get("type"), []).append(i)
+                for stitch_id in record.get("stitches_used", ()):
+                    positions = by_stitch.setdefault(stitch_id, [])
+                    # A stitch listed twice still selects the piece once
+                    if not positions or positions[-1] != i:
+                        positions.append(i)
+            groups = (records, by_type, by_stitch)
+            self._piece_groups = groups
+        return groups
+
+    def _pieces_at(self, records: List[Record], positions: List[int], include_archived: bool) -> List[Piece]:
+        """Decode the piece records at the given positions."""
+        pieces = [Piece.from_dict(records[i]) for i in positions]
+        if not include_archived:
+            pieces = [p for p in pieces if not p.archived]
+        return pieces
+
+    def pieces_by_type(self, piece_type: str, include_archived: bool = False) -> List[Piece]:
+        """Load the pieces of one type, in file order."""
+        records, by_type, _ = self._groups()
+        return self._pieces_at(records, by_type.get(piece_type, ()), include_archived)
+
+    def pieces_using_stitch(self, stitch_id: str, include_archived: bool = False) -> List[Piece]:
+        """Load the pieces that use a stitch, in file order."""
+        records, _, by_stitch = self._groups()
+        return self._pieces_at(records, by_stitch.get(stitch_id, ()), include_archived)
+
+    def load_piece_hours(self) -> List[PieceHours]:
+        """
+        Type, work status and total hours of every piece, archived included.
+
+        Computed once per version of the pieces file, so hour aggregates
+        need not decode every piece on each call.
+        """
+        data = self._load_json(self.config.PIECES_FILE)
+        records = data.get("pieces", [])
+        cached = self._piece_hours
+        if cached is None or cached[0] is not records:
+            summary = []
+            for record in records:
+                piece = Piece.from_dict(record)
+                summary.append((piece.type, piece.work_status, piece.calculate_total_hours()))
+            cached = (records, summary)
+            self._piece_hours = cached
+        return list(cached[1])
 
     def archive_piece(self, piece_id: str, reason: str = None) -> None:
         """Archive a piece (soft delete)."""
@@ -141,33 +515,30 @@ class DataService:
 
     def get_yarn_by_id(self, yarn_id: str) -> Optional[Yarn]:
         """Get a single yarn by ID."""
-        yarns = self.load_yarns(include_archived=True)
-        for yarn in yarns:
-            if yarn.id == yarn_id:
-                return yarn
-        return None
+        return self._get_by_id("yarn", Yarn, yarn_id)
+
+    def load_yarns_by_id(self) -> Dict[str, Yarn]:
+        """Map yarn IDs to yarns (read-only, shared between calls)."""
+        return self._load_by_id("yarn", Yarn)
 
     def create_yarn(self, yarn: Yarn) -> str:
         """Create a new yarn. Returns the assigned ID."""
-        if not yarn.id:
-            yarn.id = self._get_next_id("yarn")
-        yarn.created_at = datetime.now()
-        yarn.updated_at = datetime.now()
-
-        yarns = self.load_yarns(include_archived=True)
-        yarns.append(yarn)
-        self.save_yarns(yarns)
-        return yarn.id
+        return self._create("yarn", yarn)
 
     def update_yarn(self, yarn: Yarn) -> None:
         """Update an existing yarn."""
-        yarn.updated_at = datetime.now()
-        yarns = self.load_yarns(include_archived=True)
-        for i, y in enumerate(yarns):
-            if y.id == yarn.id:
-                yarns[i] = yarn
-                break
-        self.save_yarns(yarns)
+        self._update("yarn", yarn)
+
+    def yarn_stats(self, include_archived: bool = False) -> Tuple[int, int]:
+        """Count yarns and total balls owned without building Yarn objects."""
+        data = self._load_json(self.config.YARNS_FILE)
+        count = 0
+        total_balls = 0
+        for y in data.get("yarns", []):
+            if include_archived or not y.get("archived", False):
+                count += 1
+                total_balls += y.get("quantity_owned", 1) or 0
+        return count, total_balls
 
     # --- Stitches ---
 
@@ -185,32 +556,26 @@ class DataService:
         data["stitches"] = [s.to_dict() for s in stitches]
         self._save_json(self.config.STITCHES_FILE, data)
 
+    def stitch_count(self, include_archived: bool = False) -> int:
+        """Count stitches without building Stitch objects."""
+        data = self._load_json(self.config.STITCHES_FILE)
+        return sum(
+            1 for s in data.get("stitches", [])
+            if include_archived or not s.get("archived", False)
+        )
+
     def get_stitch_by_id(self, stitch_id: str) -> Optional[Stitch]:
         """Get a single stitch by ID."""
-        stitches = self.load_stitches(include_archived=True)
-        for stitch in stitches:
-            if stitch.id == stitch_id:
-                return stitch
-        return None
+        return self._get_by_id("stitch", Stitch, stitch_id)
+
+    def load_stitches_by_id(self) -> Dict[str, Stitch]:
+        """Map stitch IDs to stitches (read-only, shared between calls)."""
+        return self._load_by_id("stitch", Stitch)
 
     def create_stitch(self, stitch: Stitch) -> str:
         """Create a new stitch. Returns the assigned ID."""
-        if not stitch.id:
-            stitch.id = self._get_next_id("stitch")
-        stitch.created_at = datetime.now()
-        stitch.updated_at = datetime.now()
-
-        stitches = self.load_stitches(include_archived=True)
-        stitches.append(stitch)
-        self.save_stitches(stitches)
-        return stitch.id
+        return self._create("stitch", stitch)
 
     def update_stitch(self, stitch: Stitch) -> None:
         """Update an existing stitch."""
-        stitch.updated_at = datetime.now()
-        stitches = self.load_stitches(include_archived=True)
-        for i, s in enumerate(stitches):
-            if s.id == stitch.id:
-                stitches[i] = stitch
-                break
-        self.save_stitches(stitches)
+        self._update("stitch", stitch)
@@ -14,15 +14,28 @@ from decimal import Decimal, ROUND_HALF_UP
 from typing import Optional, Tuple, Dict, Any
 
 from ..config import config
+from ..models.piece import Piece
+from ..models.stitch import Stitch
+from ..models.yarn import Yarn
 from .data_service import DataService
 
 
+def _to_decimal(value: float) -> Decimal:
+    """
+    Convert a float price figure to Decimal.
+
+    Rounding to 9 places first only strips float noise (e.g.
+    12.4999999999 for 12.5) before the exact conversion.
+    """
+    return Decimal(repr(round(value, 9)))
+
+
 @dataclass
 class PriceConfig:
     """Configuration for price calculations."""
-    hourly_rate: Decimal = Decimal("8.00")
-    profit_margin: Decimal = Decimal("0.20")
-    min_margin: Decimal = Decimal("0.10")
+    hourly_rate: float = 8.00
+    profit_margin: float = 0.20
+    min_margin: float = 0.10
     round_to: int = 5  # Round to nearest N euros
 
 
@@ -63,7 +76,7 @@ class PriceService:
         self.price_config = price_config or PriceConfig()
         self.data_service = data_service or DataService()
 
-    def calculate_material_cost(self, piece_id: str) -> Decimal:
+    def calculate_material_cost(self, piece_id: str) -> float:
         """
         Calculate total material cost from yarns_used.
 
@@ -72,19 +85,10 @@ class PriceService:
         """
         piece = self.data_service.get_piece_by_id(piece_id)
         if not piece:
-            return Decimal("0")
-
-        total = Decimal("0")
-        for yarn_id in piece.yarns_used:
-            yarn = self.data_service.get_yarn_by_id(yarn_id)
-            if yarn and yarn.price_paid:
-                # Assume 1 ball used per yarn entry unless specified otherwise
-                # Future: support yarns_used as objects with quantity
-                total += yarn.price_paid
-
-        return total
+            return 0.0
+        return self._material_cost(piece, self.data_service.load_yarns_by_id())
 
-    def calculate_labor_cost(self, piece_id: str) -> Decimal:
+    def calculate_labor_cost(self, piece_id: str) -> float:
         """
         Calculate labor cost from work hours.
 
@@ -93,12 +97,10 @@ class PriceService:
         """
         piece = self.data_service.get_piece_by_id(piece_id)
         if not piece:
-            return Decimal("0")
-
-        hours = piece.calculate_total_hours()
-        return Decimal(str(hours)) * self.price_config.hourly_rate
+            return 0.0
+        return self._labor_cost(piece)
 
-    def get_complexity_factor(self, piece_id: str) -> Decimal:
+    def get_complexity_factor(self, piece_id: str) -> float:
         """
         Calculate complexity factor based on stitches used.
 
@@ -107,29 +109,47 @@ class PriceService:
         """
         piece = self.data_service.get_piece_by_id(piece_id)
         if not piece or not piece.stitches_used:
-            return Decimal("1.0")
+            return 1.0
+        return self._complexity_factor(piece, self.data_service.load_stitches_by_id())
 
-        factors = []
+    def _material_cost(self, piece: Piece, yarns: Dict[str, Yarn]) -> float:
+        """Material cost of a loaded piece, given yarns by ID."""
+        total = 0.0
+        for yarn_id in piece.yarns_used:
+            yarn = yarns.get(yarn_id)
+            if yarn and yarn.price_paid:
+                # Assume 1 ball used per yarn entry unless specified otherwise
+                # Future: support yarns_used as objects with quantity
+                total += float(yarn.price_paid)
+
+        return total
+
+    def _labor_cost(self, piece: Piece) -> float:
+        """Labor cost of a loaded piece."""
+        hours = piece.calculate_total_hours()
+        return hours * self.price_config.hourly_rate
+
+    def _complexity_factor(self, piece: Piece, stitches: Dict[str, Stitch]) -> float:
+        """Complexity factor of a loaded piece, given stitches by ID."""
+        complexity = config.STITCH_COMPLEXITY
+        total = 0.0
+        count = 0
         for stitch_id in piece.stitches_used:
-            stitch = self.data_service.get_stitch_by_id(stitch_id)
+            stitch = stitches.get(stitch_id)
             if stitch:
-                category = stitch.category or "basic"
-                factor = config.STITCH_COMPLEXITY.get(category, Decimal("1.0"))
-                factors.append(factor)
+                total += complexity.get(stitch.category or "basic", 1.0)
+                count += 1
 
-        if not factors:
-            return Decimal("1.0")
+        return total / count if count else 1.0
 
-        return sum(factors) / len(factors)
-
-    def get_size_factor(self, piece_type: str) -> Decimal:
+    def get_size_factor(self, piece_type: str) -> float:
         """
         Get size adjustment factor for piece type.
 
         Returns:
             Size factor from config (default 1.0).
         """
-        return config.SIZE_FACTORS.get(piece_type, Decimal("1.0"))
+        return config.SIZE_FACTORS.get(piece_type, 1.0)
 
     def calculate_price(self, piece_id: str) -> PriceBreakdown:
         """
@@ -149,38 +169,46 @@ class PriceService:
         piece = self.data_service.get_piece_by_id(piece_id)
         if not piece:
             raise ValueError(f"Piece not found: {piece_id}")
+        return self._price_breakdown(piece)
 
+    def _price_breakdown(self, piece: Piece) -> PriceBreakdown:
+        """Full price breakdown of a loaded piece (see calculate_price)."""
         # Calculate base costs
-        material_cost = self.calculate_material_cost(piece_id)
-        labor_cost = self.calculate_labor_cost(piece_id)
+        material_cost = self._material_cost(piece, self.data_service.load_yarns_by_id())
+        labor_cost = self._labor_cost(piece)
         subtotal = material_cost + labor_cost
 
         # Calculate complexity and size adjustments
-        complexity_factor = self.get_complexity_factor(piece_id)
+        complexity_factor = (
+            self._complexity_factor(piece, self.data_service.load_stitches_by_id())
+            if piece.stitches_used else 1.0
+        )
         size_factor = self.get_size_factor(piece.type)
 
         # Adjustment = subtotal × (complexity - 1) × size
-        complexity_adjustment = subtotal * (complexity_factor - Decimal("1")) * size_factor
+        complexity_adjustment = subtotal * (complexity_factor - 1.0) * size_factor
         adjusted_subtotal = subtotal + complexity_adjustment
 
         # Add profit margin
         profit_amount = adjusted_subtotal * self.price_config.profit_margin
         total = adjusted_subtotal + profit_amount
 
-        # Round to nearest N euros
+        # Round to nearest N euros, half up, on the exact Decimal total
         round_to = Decimal(str(self.price_config.round_to))
-        rounded_price = (total / round_to).quantize(Decimal("1"), rounding=ROUND_HALF_UP) * round_to
+        exact_total = _to_decimal(total)
+        rounded_price = (exact_total / round_to).quantize(Decimal("1"), rounding=ROUND_HALF_UP) * round_to
 
+        # The arithmetic above is float; the breakdown is reported in Decimal
         return PriceBreakdown(
-            material_cost=material_cost,
-            labor_cost=labor_cost,
-            subtotal=subtotal,
-            complexity_factor=complexity_factor,
-            size_factor=size_factor,
-            complexity_adjustment=complexity_adjustment,
-            adjusted_subtotal=adjusted_subtotal,
-            profit_amount=profit_amount,
-            total=total,
+            material_cost=_to_decimal(material_cost),
+            labor_cost=_to_decimal(labor_cost),
+            subtotal=_to_decimal(subtotal),
+            complexity_factor=_to_decimal(complexity_factor),
+            size_factor=_to_decimal(size_factor),
+            complexity_adjustment=_to_decimal(complexity_adjustment),
+            adjusted_subtotal=_to_decimal(adjusted_subtotal),
+            profit_amount=_to_decimal(profit_amount),
+            total=exact_total,
             rounded_price=rounded_price,
         )
 
@@ -196,17 +224,16 @@ class PriceService:
             return (Decimal("0"), Decimal("0"))
 
         # Find similar pieces (same type, same main stitch)
-        all_pieces = self.data_service.load_pieces()
+        same_type = self.data_service.pieces_by_type(piece.type)
         similar = [
-            p for p in all_pieces
-            if p.type == piece.type
-            and p.price is not None
+            p for p in same_type
+            if p.price is not None
             and p.id != piece_id
         ]
 
         if not similar:
             # No similar pieces, use calculated price with ±20%
-            breakdown = self.calculate_price(piece_id)
+            breakdown = self._price_breakdown(piece)
             base = breakdown.rounded_price
             return (
                 base * Decimal("0.8"),
@@ -227,19 +254,19 @@ class PriceService:
         if not piece:
             return {"error": "Piece not found"}
 
-        breakdown = self.calculate_price(piece_id)
+        breakdown = self._price_breakdown(piece)
         suggested = breakdown.rounded_price
 
         # Find sold pieces of same type
-        all_pieces = self.data_service.load_pieces(include_archived=True)
-        sold_similar = [
-            p for p in all_pieces
-            if p.type == piece.type
-            and p.destination == "sold"
+        same_type = self.data_service.pieces_by_type(piece.type, include_archived=True)
+        # Only the prices are needed, so collect them as floats directly
+        sold_prices = [
+            float(p.sold_price) for p in same_type
+            if p.destination == "sold"
             and p.sold_price is not None
         ]
 
-        if not sold_similar:
+        if not sold_prices:
             return {
                 "suggested_price": float(suggested),
                 "avg_sold_price": None,
@@ -247,9 +274,10 @@ class PriceService:
                 "recommendation": "Use suggested price as starting point",
             }
 
-        avg_sold = sum(p.sold_price for p in sold_similar) / len(sold_similar)
-        diff = suggested - avg_sold
-        diff_pct = (diff / avg_sold * 100) if avg_sold else Decimal("0")
+        # Everything below is reported as float, so compute in float
+        avg_sold = sum(sold_prices) / len(sold_prices)
+        diff = float(suggested) - avg_sold
+        diff_pct = (diff / avg_sold * 100) if avg_sold else 0.0
 
         if diff_pct > 20:
             recommendation = "Suggested price is significantly higher than market average. Consider lowering."
@@ -260,9 +288,9 @@ class PriceService:
 
         return {
             "suggested_price": float(suggested),
-            "avg_sold_price": float(avg_sold),
-            "difference": float(diff),
-            "difference_pct": float(diff_pct),
-            "similar_pieces_count": len(sold_similar),
+            "avg_sold_price": avg_sold,
+            "difference": diff,
+            "difference_pct": diff_pct,
+            "similar_pieces_count": len(sold_prices),
             "recommendation": recommendation,
         }
@@ -7,6 +7,7 @@ Calculates and estimates work times based on:
 - Style averages
 """
 
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, timedelta
 from typing import List, Optional, Dict, Any
@@ -14,6 +15,9 @@ from typing import List, Optional, Dict, Any
 from ..models.piece import WorkSession
 from .data_service import DataService
 
+# Work statuses of pieces whose logged hours are final
+_FINISHED = frozenset(("finished", "ready"))
+
 
 @dataclass
 class TimeEstimate:
@@ -69,19 +73,18 @@ class TimeService:
         Returns:
             Average hours or None if no data.
         """
-        pieces = self.data_service.load_pieces(include_archived=True)
-        finished = [
-            p for p in pieces
-            if p.type == piece_type
-            and p.work_status in ("finished", "ready")
-            and p.calculate_total_hours() > 0
+        pieces = self.data_service.pieces_by_type(piece_type, include_archived=True)
+        # Hours of each matching piece, computed once per piece
+        hours = [
+            h for p in pieces
+            if p.work_status in _FINISHED
+            and (h := p.calculate_total_hours()) > 0
         ]
 
-        if not finished:
+        if not hours:
             return None
 
-        total = sum(p.calculate_total_hours() for p in finished)
-        return total / len(finished)
+        return sum(hours) / len(hours)
 
     def get_average_hours_by_stitch(self, stitch_id: str, piece_type: str = None) -> Optional[float]:
         """
@@ -94,22 +97,19 @@ class TimeService:
         Returns:
             Average hours or None if no data.
         """
-        pieces = self.data_service.load_pieces(include_archived=True)
-        matching = [
-            p for p in pieces
-            if stitch_id in p.stitches_used
-            and p.work_status in ("finished", "ready")
-            and p.calculate_total_hours() > 0
+        pieces = self.data_service.pieces_using_stitch(stitch_id, include_archived=True)
+        # Hours of each matching piece, computed once per piece
+        hours = [
+            h for p in pieces
+            if (not piece_type or p.type == piece_type)
+            and p.work_status in _FINISHED
+            and (h := p.calculate_total_hours()) > 0
         ]
 
-        if piece_type:
-            matching = [p for p in matching if p.type == piece_type]
-
-        if not matching:
+        if not hours:
             return None
 
-        total = sum(p.calculate_total_hours() for p in matching)
-        return total / len(matching)
+        return sum(hours) / len(hours)
 
     def estimate_total_hours(self, piece_id: str) -> TimeEstimate:
         """
@@ -141,7 +141,7 @@ class TimeService:
         logged_hours = piece.calculate_total_hours()
 
         # If finished, return actual hours
-        if piece.work_status in ("finished", "ready"):
+        if piece.work_status in _FINISHED:
             return TimeEstimate(
                 total_hours_logged=logged_hours,
                 estimated_total_hours=logged_hours,
@@ -228,29 +228,31 @@ class TimeService:
         Returns:
             Dict with various time statistics.
         """
-        pieces = self.data_service.load_pieces(include_archived=True)
-
-        # Calculate averages by type
-        type_stats = {}
-        for piece in pieces:
-            if piece.work_status in ("finished", "ready") and piece.calculate_total_hours() > 0:
-                if piece.type not in type_stats:
-                    type_stats[piece.type] = {"total_hours": 0, "count": 0}
-                type_stats[piece.type]["total_hours"] += piece.calculate_total_hours()
-                type_stats[piece.type]["count"] += 1
-
-        for ptype, stats in type_stats.items():
-            stats["average_hours"] = stats["total_hours"] / stats["count"] if stats["count"] > 0 else 0
-
-        # Total hours across all pieces
-        total_hours = sum(p.calculate_total_hours() for p in pieces)
-
-        # In progress pieces
-        in_progress = [p for p in pieces if p.work_status == "in_progress"]
+        # Hours come precomputed per piece from the data service
+        piece_hours = self.data_service.load_piece_hours()
+
+        # One pass: per-type totals for finished pieces, overall counters
+        type_stats = defaultdict(lambda: {"total_hours": 0, "count": 0})
+        total_hours = 0
+        completed = 0
+        in_progress = 0
+        for piece_type, status, hours in piece_hours:
+            total_hours += hours
+            if status in _FINISHED:
+                completed += 1
+                if hours > 0:
+                    stats = type_stats[piece_type]
+                    stats["total_hours"] += hours
+                    stats["count"] += 1
+            elif status == "in_progress":
+                in_progress += 1
+
+        for stats in type_stats.values():
+            stats["average_hours"] = stats["total_hours"] / stats["count"]
 
         return {
             "total_hours_all_time": total_hours,
-            "pieces_completed": len([p for p in pieces if p.work_status in ("finished", "ready")]),
-            "pieces_in_progress": len(in_progress),
-            "averages_by_type": type_stats,
+            "pieces_completed": completed,
+            "pieces_in_progress": in_progress,
+            "averages_by_type": dict(type_stats),
         }
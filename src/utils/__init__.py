@@ -1,13 +1,59 @@
 """
 Utility functions for Crochet Project Manager.
+
+Submodules are imported on first attribute access, so importing one
+utility does not load the others.
 """
 
-from .id_generator import IDGenerator
-from .date_utils import DateUtils
-from .photo_utils import PhotoUtils
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .id_generator import IDGenerator
+    from .date_utils import (
+        DateUtils,
+        date_range_days,
+        extract_date_from_filename,
+        format_date,
+        get_week_info,
+        parse_date,
+    )
+    from .photo_utils import PhotoUtils
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "IDGenerator": ".id_generator",
+    "DateUtils": ".date_utils",
+    "date_range_days": ".date_utils",
+    "extract_date_from_filename": ".date_utils",
+    "format_date": ".date_utils",
+    "get_week_info": ".date_utils",
+    "parse_date": ".date_utils",
+    "PhotoUtils": ".photo_utils",
+}
 
 __all__ = [
     "IDGenerator",
     "DateUtils",
+    "date_range_days",
+    "extract_date_from_filename",
+    "format_date",
+    "get_week_info",
+    "parse_date",
     "PhotoUtils",
 ]
+
+
+def __getattr__(name: str):
+    """Import an exported name from its submodule on first use."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    """Include the not yet imported exports."""
+    return sorted(set(globals()) | set(__all__))
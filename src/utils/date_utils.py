@@ -2,6 +2,7 @@
 Date parsing and formatting utilities.
 
 Handles extraction of dates from filenames and various date formats.
+The functions are also available as static methods of DateUtils.
 """
 
 import re
@@ -9,131 +10,192 @@ from datetime import date, datetime
 from typing import Optional, Tuple
 
 
-class DateUtils:
-    """Date parsing and formatting utilities."""
-
-    # Common date patterns in filenames
-    FILENAME_PATTERNS = [
-        # YYYYMMDD
-        (r"(\d{4})(\d{2})(\d{2})", "%Y%m%d"),
-        # YYYY-MM-DD
-        (r"(\d{4})-(\d{2})-(\d{2})", "%Y-%m-%d"),
-        # YYYY_MM_DD
-        (r"(\d{4})_(\d{2})_(\d{2})", "%Y_%m_%d"),
-        # DD-MM-YYYY
-        (r"(\d{2})-(\d{2})-(\d{4})", "%d-%m-%Y"),
-        # DD_MM_YYYY
-        (r"(\d{2})_(\d{2})_(\d{4})", "%d_%m_%Y"),
-    ]
-
-    @classmethod
-    def extract_date_from_filename(cls, filename: str) -> Optional[date]:
-        """
-        Extract a date from a filename.
-
-        Handles common patterns like:
-        - IMG_20260115.jpg -> 2026-01-15
-        - 2026-01-15_photo.jpg -> 2026-01-15
-        - screenshot_15-01-2026.png -> 2026-01-15
-
-        Args:
-            filename: Filename to parse.
-
-        Returns:
-            Extracted date or None if not found.
-        """
-        for pattern, date_format in cls.FILENAME_PATTERNS:
-            match = re.search(pattern, filename)
-            if match:
+def _field_groups(date_format: str) -> Tuple[int, int, int]:
+    """Regex group numbers holding year, month and day for a format."""
+    order = sorted("Ymd", key=lambda c: date_format.index("%" + c))
+    return tuple(order.index(c) + 1 for c in "Ymd")
+
+
+# Common date patterns in filenames
+FILENAME_PATTERNS = [
+    # YYYYMMDD
+    (r"(\d{4})(\d{2})(\d{2})", "%Y%m%d"),
+    # YYYY-MM-DD
+    (r"(\d{4})-(\d{2})-(\d{2})", "%Y-%m-%d"),
+    # YYYY_MM_DD
+    (r"(\d{4})_(\d{2})_(\d{2})", "%Y_%m_%d"),
+    # DD-MM-YYYY
+    (r"(\d{2})-(\d{2})-(\d{4})", "%d-%m-%Y"),
+    # DD_MM_YYYY
+    (r"(\d{2})_(\d{2})_(\d{4})", "%d_%m_%Y"),
+]
+
+# Compiled patterns with the year/month/day group numbers of each
+_COMPILED_PATTERNS = tuple(
+    (re.compile(pattern), _field_groups(date_format))
+    for pattern, date_format in FILENAME_PATTERNS
+)
+
+# Accepted date formats, in order of precedence
+PARSE_FORMATS = (
+    "%Y-%m-%d",  # ISO format
+    "%d/%m/%Y",  # European
+    "%m/%d/%Y",  # American
+    "%d-%m-%Y",
+    "%Y/%m/%d",
+    "%B %d, %Y",  # "January 15, 2026"
+    "%d %B %Y",   # "15 January 2026"
+    "%b %d, %Y",  # "Jan 15, 2026"
+    "%d %b %Y",   # "15 Jan 2026"
+)
+
+# (separator, leads) shape -> the only PARSE_FORMATS that can match it
+_PARSE_FORMATS_BY_SHAPE = {
+    ("-", True): ("%Y-%m-%d",),
+    ("-", False): ("%d-%m-%Y",),
+    ("/", True): ("%Y/%m/%d",),
+    ("/", False): ("%d/%m/%Y", "%m/%d/%Y"),
+    (" ", False): ("%B %d, %Y", "%b %d, %Y"),
+    (" ", True): ("%d %B %Y", "%d %b %Y"),
+}
+
+# format_date types -> strftime formats
+_OUTPUT_FORMATS = {
+    "iso": "%Y-%m-%d",
+    "display": "%d %B %Y",
+    "filename": "%Y%m%d",
+    "short": "%d/%m/%Y",
+}
+
+
+def extract_date_from_filename(filename: str) -> Optional[date]:
+    """
+    Extract a date from a filename.
+
+    Handles common patterns like:
+    - IMG_20260115.jpg -> 2026-01-15
+    - 2026-01-15_photo.jpg -> 2026-01-15
+    - screenshot_15-01-2026.png -> 2026-01-15
+
+    Args:
+        filename: Filename to parse.
+
+    Returns:
+        Extracted date or None if not found.
+    """
+    for pattern, (year_group, month_group, day_group) in _COMPILED_PATTERNS:
+        match = pattern.search(filename)
+        if match:
+            # Groups are all digits, so build the date without strptime
+            year = int(match.group(year_group))
+            # Validate reasonable date range
+            if 2000 <= year <= 2100:
                 try:
-                    date_str = match.group(0)
-                    parsed = datetime.strptime(date_str, date_format)
-                    # Validate reasonable date range
-                    if 2000 <= parsed.year <= 2100:
-                        return parsed.date()
+                    return date(year, int(match.group(month_group)), int(match.group(day_group)))
                 except ValueError:
                     continue
-        return None
-
-    @classmethod
-    def parse_date(cls, date_string: str) -> Optional[date]:
-        """
-        Parse a date from various string formats.
-
-        Args:
-            date_string: Date string to parse.
-
-        Returns:
-            Parsed date or None if invalid.
-        """
-        formats = [
-            "%Y-%m-%d",  # ISO format
-            "%d/%m/%Y",  # European
-            "%m/%d/%Y",  # American
-            "%d-%m-%Y",
-            "%Y/%m/%d",
-            "%B %d, %Y",  # "January 15, 2026"
-            "%d %B %Y",   # "15 January 2026"
-            "%b %d, %Y",  # "Jan 15, 2026"
-            "%d %b %Y",   # "15 Jan 2026"
-        ]
-
-        date_string = date_string.strip()
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_string, fmt).date()
-            except ValueError:
-                continue
-
-        return None
-
-    @classmethod
-    def format_date(cls, d: date, format_type: str = "iso") -> str:
-        """
-        Format a date for display or storage.
-
-        Args:
-            d: Date to format.
-            format_type: "iso", "display", "filename".
-
-        Returns:
-            Formatted date string.
-        """
-        formats = {
-            "iso": "%Y-%m-%d",
-            "display": "%d %B %Y",
-            "filename": "%Y%m%d",
-            "short": "%d/%m/%Y",
-        }
-
-        fmt = formats.get(format_type, formats["iso"])
-        return d.strftime(fmt)
-
-    @classmethod
-    def date_range_days(cls, start: date, end: date) -> int:
-        """
-        Calculate days between two dates.
-
-        Args:
-            start: Start date.
-            end: End date.
-
-        Returns:
-            Number of days between dates.
-        """
-        return (end - start).days
-
-    @classmethod
-    def get_week_info(cls, d: date) -> Tuple[int, int]:
-        """
-        Get week number and year for a date.
-
-        Args:
-            d: Date to analyze.
-
-        Returns:
-            Tuple of (week_number, year).
-        """
-        iso_calendar = d.isocalendar()
-        return (iso_calendar.week, iso_calendar.year)
+    return None
+
+
+def parse_date(date_string: str) -> Optional[date]:
+    """
+    Parse a date from various string formats.
+
+    Args:
+        date_string: Date string to parse.
+
+    Returns:
+        Parsed date or None if invalid.
+    """
+    date_string = date_string.strip()
+
+    # Only the formats matching the string's shape can parse it; the
+    # full list stays as a fallback for anything unusual
+    candidates = _PARSE_FORMATS_BY_SHAPE.get(_date_shape(date_string), ())
+    for fmt in candidates:
+        try:
+            return datetime.strptime(date_string, fmt).date()
+        except ValueError:
+            continue
+
+    for fmt in PARSE_FORMATS:
+        if fmt in candidates:
+            continue
+        try:
+            return datetime.strptime(date_string, fmt).date()
+        except ValueError:
+            continue
+
+    return None
+
+
+def _date_shape(date_string: str) -> Tuple[str, bool]:
+    """
+    Classify a date string by separator and what it starts with.
+
+    Returns:
+        Tuple of (separator, leads) where leads is True when a numeric
+        date starts with the 4-digit year, or a worded date with the
+        day number.
+    """
+    for sep in ("-", "/"):
+        pos = date_string.find(sep)
+        if pos != -1:
+            return (sep, pos == 4)
+    return (" ", date_string[:1].isdigit())
+
+
+def format_date(d: date, format_type: str = "iso") -> str:
+    """
+    Format a date for display or storage.
+
+    Args:
+        d: Date to format.
+        format_type: "iso", "display", "filename".
+
+    Returns:
+        Formatted date string.
+    """
+    fmt = _OUTPUT_FORMATS.get(format_type, _OUTPUT_FORMATS["iso"])
+    return d.strftime(fmt)
+
+
+def date_range_days(start: date, end: date) -> int:
+    """
+    Calculate days between two dates.
+
+    Args:
+        start: Start date.
+        end: End date.
+
+    Returns:
+        Number of days between dates.
+    """
+    return (end - start).days
+
+
+def get_week_info(d: date) -> Tuple[int, int]:
+    """
+    Get week number and year for a date.
+
+    Args:
+        d: Date to analyze.
+
+    Returns:
+        Tuple of (week_number, year).
+    """
+    iso_calendar = d.isocalendar()
+    return (iso_calendar[1], iso_calendar[0])
+
+
+class DateUtils:
+    """Date parsing and formatting utilities (namespace for the functions above)."""
+
+    FILENAME_PATTERNS = FILENAME_PATTERNS
+    PARSE_FORMATS = PARSE_FORMATS
+
+    extract_date_from_filename = staticmethod(extract_date_from_filename)
+    parse_date = staticmethod(parse_date)
+    format_date = staticmethod(format_date)
+    date_range_days = staticmethod(date_range_days)
+    get_week_info = staticmethod(get_week_info)
@@ -5,8 +5,7 @@ Generates sequential IDs for pieces, yarns, and stitches
 following the format: ENTITY-NNN (e.g., PIECE-001, YARN-042).
 """
 
-import re
-from typing import List, Optional
+from typing import Iterable, List, Mapping, Optional
 
 
 class IDGenerator:
@@ -24,6 +23,42 @@ class IDGenerator:
         "stitch": "STITCH-",
     }
 
+    # The prefixes start with distinct letters, so the first character
+    # alone picks the candidate type
+    _TYPE_BY_INITIAL = {prefix[0]: entity_type for entity_type, prefix in PREFIXES.items()}
+
+    def __init__(self, existing_by_type: Optional[Mapping[str, Iterable[str]]] = None):
+        """
+        Create a generator that hands out IDs without rescanning.
+
+        The existing IDs are scanned once here; next_id() then counts up
+        from the highest number of each type. Use one instance for bulk
+        inserts instead of calling get_next_id() per item.
+
+        Args:
+            existing_by_type: Existing IDs keyed by entity type.
+        """
+        existing_by_type = existing_by_type or {}
+        self._max = {
+            entity_type: self._max_number(prefix, existing_by_type.get(entity_type, ()))
+            for entity_type, prefix in self.PREFIXES.items()
+        }
+
+    def next_id(self, entity_type: str) -> str:
+        """
+        Allocate the next sequential ID for an entity type.
+
+        Args:
+            entity_type: "piece", "yarn", or "stitch".
+
+        Returns:
+            Next ID string (e.g., "PIECE-043").
+        """
+        if entity_type not in self._max:
+            raise ValueError(f"Unknown entity type: {entity_type}")
+        self._max[entity_type] += 1
+        return self.PATTERNS[entity_type].format(self._max[entity_type])
+
     @classmethod
     def extract_number(cls, entity_id: str) -> Optional[int]:
         """
@@ -35,9 +70,10 @@ class IDGenerator:
         Returns:
             The numeric part (42) or None if invalid.
         """
-        match = re.search(r"-(\d+)$", entity_id)
-        if match:
-            return int(match.group(1))
+        _, sep, tail = entity_id.rpartition("-")
+        # isdecimal() accepts exactly the digits int() parses
+        if sep and tail.isdecimal():
+            return int(tail)
         return None
 
     @classmethod
@@ -55,17 +91,20 @@ class IDGenerator:
         if entity_type not in cls.PATTERNS:
             raise ValueError(f"Unknown entity type: {entity_type}")
 
-        prefix = cls.PREFIXES[entity_type]
-        pattern = cls.PATTERNS[entity_type]
+        max_num = cls._max_number(cls.PREFIXES[entity_type], existing_ids)
+        return cls.PATTERNS[entity_type].format(max_num + 1)
 
-        max_num = 0
-        for eid in existing_ids:
-            if eid.startswith(prefix):
-                num = cls.extract_number(eid)
-                if num is not None and num > max_num:
-                    max_num = num
-
-        return pattern.format(max_num + 1)
+    @classmethod
+    def _max_number(cls, prefix: str, existing_ids: Iterable[str]) -> int:
+        """Highest number among the IDs with a prefix, or 0 if none."""
+        extract_number = cls.extract_number
+        return max(
+            (
+                num for eid in existing_ids
+                if eid.startswith(prefix) and (num := extract_number(eid)) is not None
+            ),
+            default=0,
+        )
 
     @classmethod
     def validate_id(cls, entity_id: str, entity_type: str = None) -> bool:
@@ -81,14 +120,16 @@ class IDGenerator:
         """
         if entity_type:
             prefix = cls.PREFIXES.get(entity_type)
-            if not prefix:
+            if not prefix or not entity_id.startswith(prefix):
                 return False
-            if not entity_id.startswith(prefix):
+        else:
+            detected = cls.get_entity_type(entity_id)
+            if detected is None:
                 return False
+            prefix = cls.PREFIXES[detected]
 
-        # Check format: PREFIX-NNN
-        pattern = r"^(PIECE|YARN|STITCH)-\d{3}$"
-        return bool(re.match(pattern, entity_id))
+        # Check format: PREFIX-NNN, exactly three digits after the prefix
+        return len(entity_id) == len(prefix) + 3 and entity_id[-3:].isdecimal()
 
     @classmethod
     def get_entity_type(cls, entity_id: str) -> Optional[str]:
@@ -101,7 +142,7 @@ class IDGenerator:
         Returns:
             Entity type ("piece", "yarn", "stitch") or None.
         """
-        for entity_type, prefix in cls.PREFIXES.items():
-            if entity_id.startswith(prefix):
-                return entity_type
+        entity_type = cls._TYPE_BY_INITIAL.get(entity_id[:1])
+        if entity_type is not None and entity_id.startswith(cls.PREFIXES[entity_type]):
+            return entity_type
         return None